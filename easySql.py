@@ -5,200 +5,506 @@ A PyQt6-based educational tool for learning SQL with SQLite
 Supports English and Spanish, includes beginner and advanced lessons
 """
 
+import json
+import os
 import sys
 import sqlite3
+import threading
+import time
+from collections import deque, namedtuple
+from functools import lru_cache, wraps
+from itertools import groupby, islice
+from urllib.parse import quote
 from datetime import datetime
+from types import MappingProxyType
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QPushButton, QTextEdit, QTableView, QLabel,
+    QTabWidget, QPushButton, QTextEdit, QPlainTextEdit, QTableView, QLabel,
     QComboBox, QMessageBox, QScrollArea, QCheckBox, QSplitter,
-    QMenuBar, QMenu
+    QMenuBar, QMenu, QStyle
 )
-from PyQt6.QtCore import Qt, QAbstractTableModel, pyqtSignal
-from PyQt6.QtGui import QAction
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QSettings, QThreadPool,
+    QTimer, pyqtSignal
+)
+from PyQt6.QtGui import QAction, QIcon, QTextCursor
 
 
 # ===========================
 # Database Manager
 # ===========================
 
+# Hot-path statements are kept as constants so sqlite3's statement cache
+# always sees identical text and never re-parses them
+_INSERT_HISTORY_SQL = (
+    "INSERT INTO query_history (query_text, executed_at, success, error_message) VALUES (?, ?, ?, ?)"
+)
+_SELECT_HISTORY_SQL = (
+    "SELECT query_text, executed_at, success, error_message FROM query_history ORDER BY id DESC LIMIT ?"
+)
+_MARK_LESSON_SQL = (
+    "INSERT OR REPLACE INTO lesson_progress (lesson_id, completed, completed_at) VALUES (?, 1, ?)"
+)
+_LESSON_COMPLETE_SQL = "SELECT completed FROM lesson_progress WHERE lesson_id = ?"
+_COMPLETED_LESSONS_SQL = "SELECT lesson_id FROM lesson_progress WHERE completed = 1"
+
+# INSERT ... RETURNING needs SQLite 3.35+; older libraries re-read the row by rowid
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS students (
+        student_id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        email TEXT UNIQUE,
+        age INTEGER,
+        country TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS courses (
+        course_id INTEGER PRIMARY KEY,
+        course_name TEXT NOT NULL,
+        instructor TEXT,
+        credits INTEGER
+    );
+
+    CREATE TABLE IF NOT EXISTS enrollments (
+        enrollment_id INTEGER PRIMARY KEY,
+        student_id INTEGER,
+        course_id INTEGER,
+        enrollment_date TEXT,
+        grade REAL,
+        FOREIGN KEY (student_id) REFERENCES students(student_id),
+        FOREIGN KEY (course_id) REFERENCES courses(course_id)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_enr_student ON enrollments(student_id);
+    CREATE INDEX IF NOT EXISTS idx_enr_course ON enrollments(course_id);
+
+    CREATE TABLE IF NOT EXISTS lesson_progress (
+        lesson_id TEXT PRIMARY KEY,
+        completed INTEGER DEFAULT 0,
+        completed_at INTEGER
+    );
+
+    CREATE TABLE IF NOT EXISTS query_history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        query_text TEXT NOT NULL,
+        executed_at INTEGER NOT NULL,
+        success INTEGER,
+        error_message TEXT
+    );
+"""
+
+
+_CLOSED_ERROR = "Cannot operate on a closed database."
+
+
+def _synchronized(method):
+    """Serialize a DatabaseManager method on the manager's connection lock"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            if self.conn is None:
+                raise sqlite3.ProgrammingError(_CLOSED_ERROR)
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _quote_identifier(name):
+    """Quote a table/column name for safe interpolation into SQL"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _sql_literal(value):
+    """Render a Python value as an SQL literal"""
+    if value is None:
+        return 'NULL'
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return repr(value)
+
+
+def _format_timestamp(value):
+    """Format a stored epoch-nanosecond timestamp for display"""
+    # Databases created by older versions still hold ISO-8601 text
+    if isinstance(value, str) and not value.isdigit():
+        return value
+    return datetime.fromtimestamp(int(value) / 1e9).isoformat()
+
+
+def _first_keyword(query):
+    """Return the lowercased leading keyword of a query, ignoring comments"""
+    i = 0
+    n = len(query)
+    # Skip leading whitespace and comments without copying the query
+    while i < n:
+        if query[i].isspace():
+            i += 1
+        elif query.startswith('--', i):
+            i = query.find('\n', i)
+            if i < 0:
+                return ''
+        elif query.startswith('/*', i):
+            i = query.find('*/', i + 2)
+            if i < 0:
+                return ''
+            i += 2
+        else:
+            break
+
+    end = i
+    while end < n and (query[end].isalnum() or query[end] == '_'):
+        end += 1
+    return query[i:end].lower()
+
+
+def _is_select(query):
+    """Check whether a query starts with SELECT or WITH"""
+    return _first_keyword(query) in ('select', 'with')
+
+
+def _is_schema_change(query):
+    """Check whether a query is DDL that can change table definitions"""
+    return _first_keyword(query) in ('create', 'drop', 'alter')
+
+
+# Sample data for learning, as (table, rows) pairs
+_SAMPLE_DATA = (
+    ('students', (
+        (1, 'Alice Johnson', 'alice@email.com', 20, 'USA'),
+        (2, 'Bob Smith', 'bob@email.com', 22, 'Canada'),
+        (3, 'Carlos García', 'carlos@email.com', 21, 'Spain'),
+        (4, 'Diana Lee', 'diana@email.com', 19, 'South Korea'),
+        (5, 'Elena Rodríguez', 'elena@email.com', 23, 'Mexico'),
+        (6, 'Frank Miller', 'frank@email.com', 20, 'UK'),
+        (7, 'Gabriela Silva', 'gabi@email.com', 22, 'Brazil'),
+        (8, 'Hassan Ahmed', 'hassan@email.com', 21, 'Egypt')
+    )),
+    ('courses', (
+        (1, 'Introduction to Programming', 'Dr. Smith', 3),
+        (2, 'Database Systems', 'Prof. Johnson', 4),
+        (3, 'Web Development', 'Dr. García', 3),
+        (4, 'Data Structures', 'Prof. Lee', 4),
+        (5, 'Machine Learning', 'Dr. Chen', 3),
+        (6, 'Computer Networks', 'Prof. Williams', 3)
+    )),
+    ('enrollments', (
+        (1, 1, 1, '2024-01-15', 3.8),
+        (2, 1, 2, '2024-01-15', 3.5),
+        (3, 2, 1, '2024-01-16', 3.2),
+        (4, 2, 3, '2024-01-16', 3.9),
+        (5, 3, 2, '2024-01-17', 4.0),
+        (6, 3, 4, '2024-01-17', 3.7),
+        (7, 4, 1, '2024-01-18', 3.6),
+        (8, 4, 5, '2024-01-18', 3.8),
+        (9, 5, 3, '2024-01-19', 3.4),
+        (10, 5, 4, '2024-01-19', 3.9),
+        (11, 6, 2, '2024-01-20', 3.3),
+        (12, 6, 6, '2024-01-20', 3.7),
+        (13, 7, 1, '2024-01-21', 3.5),
+        (14, 8, 5, '2024-01-22', 3.6)
+    ))
+)
+
+# One multi-row INSERT per sample table, built once at import. Values are
+# inlined so a reset can run the whole seed inside a single executescript.
+_SEED_STATEMENTS = tuple(
+    f"INSERT OR IGNORE INTO {table_name} VALUES "
+    + ', '.join('(' + ', '.join(_sql_literal(value) for value in row) + ')' for row in rows)
+    for table_name, rows in _SAMPLE_DATA
+)
+
+
+class _HistoryWriter(QRunnable):
+    """Writes one batch of query history rows on the database writer thread"""
+
+    def __init__(self, db, batch):
+        super().__init__()
+        self._db = db
+        self._batch = batch
+
+    def run(self):
+        conn = self._db._writer_connection()
+        try:
+            conn.execute("BEGIN")
+            conn.executemany(_INSERT_HISTORY_SQL, self._batch)
+            conn.commit()
+            written = True
+        except sqlite3.Error:
+            # e.g. "database is locked" while a long user write holds the database
+            conn.rollback()
+            written = False
+        db = self._db
+        with db._history_lock:
+            db._history_in_flight.remove(self._batch)
+            if not written:
+                # Put the rows back ahead of newer ones; the next flush retries them
+                rows = self._batch + list(db._history_buffer)
+                db._history_buffer.clear()
+                db._history_buffer.extend(rows)
+
+
 class DatabaseManager:
     """Manages SQLite database operations, schema, and data"""
 
-    def __init__(self, db_path="easysql_learning.db"):
+    # Number of buffered history rows that triggers a batched write
+    HISTORY_FLUSH_THRESHOLD = 32
+
+    # VM instructions between checks for a cancelled query
+    CANCEL_CHECK_INSTRUCTIONS = 1000
+
+    def __init__(self, db_path="easysql_learning.db", unsafe_fast_writes=False):
         self.db_path = db_path
+        # synchronous=OFF trades crash safety for speed, so it is opt-in only
+        self.unsafe_fast_writes = unsafe_fast_writes
         self.conn = None
         self.cursor = None
+        # self.conn is shared across threads (check_same_thread=False);
+        # every method that touches self.cursor holds this lock
+        self._lock = threading.RLock()
+        # PRAGMA table_info results and primary key columns per table,
+        # dropped whenever DDL runs
+        self._schema_cache = {}
+        self._pk_cache = {}
+        # Prebuilt "SELECT * FROM <table> LIMIT ? OFFSET ?" text per table, reused per page
+        self._select_page_sql = {}
+        # Prebuilt "UPDATE <table> SET <column> = ? WHERE <pk> = ?" text per cell target
+        self._update_sql = {}
+        # Values add_table_row inserts into a new row, per table
+        self._default_row_cache = {}
+        # Query history rows not yet written to disk (oldest first); the
+        # buffer and in-flight list are guarded by _history_lock
+        self._history_buffer = deque(maxlen=1000)
+        # Bumped for every history row saved, so views can tell they are stale
+        self.history_version = 0
+        # History is written on a single background thread (SQLite allows one
+        # writer) with its own connection, so the UI thread never waits on it
+        self._writer_pool = QThreadPool()
+        self._writer_pool.setMaxThreadCount(1)
+        self._writer_local = threading.local()
+        self._history_lock = threading.Lock()
+        self._history_in_flight = []  # batches handed to the writer thread
+        # User queries run on the query thread's own connection, so a long
+        # statement never holds self.conn or self._lock
+        self._query_local = threading.local()
         self.connect()
         self.initialize_database()
 
     def connect(self):
         """Establish database connection"""
-        self.conn = sqlite3.connect(self.db_path)
+        self.conn = self._open_connection()
+        # Rows share one column-name map instead of each carrying its own
+        self.conn.row_factory = sqlite3.Row
         self.cursor = self.conn.cursor()
 
+    def _open_connection(self):
+        """Open and configure a new SQLite connection"""
+        # Autocommit at the driver level: single-statement writes commit on
+        # their own, multi-statement work opens a transaction explicitly
+        conn = sqlite3.connect(
+            f"file:{quote(self.db_path)}?mode=rwc",
+            uri=True,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256
+        )
+
+        # WAL + synchronous=NORMAL makes each commit an append to the log
+        # instead of a full fsync of the database file
+        synchronous = 'OFF' if self.unsafe_fast_writes else 'NORMAL'
+        conn.executescript(f"""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous={synchronous};
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+            PRAGMA busy_timeout=5000;
+        """)
+        return conn
+
+    def _writer_connection(self):
+        """Return the calling thread's private connection for background writes"""
+        conn = getattr(self._writer_local, 'conn', None)
+        if conn is None:
+            conn = self._open_connection()
+            self._writer_local.conn = conn
+        return conn
+
+    def _query_connection(self):
+        """Return the calling thread's private connection for user queries"""
+        conn = getattr(self._query_local, 'conn', None)
+        if conn is None:
+            conn = self._open_connection()
+            conn.row_factory = sqlite3.Row
+            self._query_local.conn = conn
+        return conn
+
+    @_synchronized
     def initialize_database(self):
         """Create tables and populate with sample data"""
-        # Create main learning tables
-        self.cursor.executescript("""
-            CREATE TABLE IF NOT EXISTS students (
-                student_id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                email TEXT UNIQUE,
-                age INTEGER,
-                country TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS courses (
-                course_id INTEGER PRIMARY KEY,
-                course_name TEXT NOT NULL,
-                instructor TEXT,
-                credits INTEGER
-            );
-
-            CREATE TABLE IF NOT EXISTS enrollments (
-                enrollment_id INTEGER PRIMARY KEY,
-                student_id INTEGER,
-                course_id INTEGER,
-                enrollment_date TEXT,
-                grade REAL,
-                FOREIGN KEY (student_id) REFERENCES students(student_id),
-                FOREIGN KEY (course_id) REFERENCES courses(course_id)
-            );
-
-            CREATE TABLE IF NOT EXISTS lesson_progress (
-                lesson_id TEXT PRIMARY KEY,
-                completed INTEGER DEFAULT 0,
-                completed_at TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS query_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                query_text TEXT NOT NULL,
-                executed_at TEXT NOT NULL,
-                success INTEGER,
-                error_message TEXT
-            );
+        # Create main learning tables. The whole init (DDL + seed) runs in a
+        # single write transaction so it costs one sync instead of several.
+        self.cursor.executescript("BEGIN IMMEDIATE;" + _SCHEMA_SQL)
+
+        # Check if sample data exists in any table (EXISTS stops at the first row)
+        self.cursor.execute("""
+            SELECT (SELECT EXISTS(SELECT 1 FROM students))
+                 + (SELECT EXISTS(SELECT 1 FROM courses))
+                 + (SELECT EXISTS(SELECT 1 FROM enrollments))
         """)
-
-        # Check if sample data exists in all tables
-        self.cursor.execute("SELECT COUNT(*) FROM students")
-        students_count = self.cursor.fetchone()[0]
-
-        self.cursor.execute("SELECT COUNT(*) FROM courses")
-        courses_count = self.cursor.fetchone()[0]
-
-        self.cursor.execute("SELECT COUNT(*) FROM enrollments")
-        enrollments_count = self.cursor.fetchone()[0]
+        populated_tables = self.cursor.fetchone()[0]
 
         # Only populate if all tables are empty
-        if students_count == 0 and courses_count == 0 and enrollments_count == 0:
+        if populated_tables == 0:
             self._populate_sample_data()
+            # Gather statistics so the planner picks up the enrollments indexes
+            self.cursor.execute("ANALYZE")
 
         self.conn.commit()
 
+        # Warm the primary key cache so cell edits never hit PRAGMA table_info
+        for table in self.get_table_names():
+            self.get_primary_key(table)
+
     def _populate_sample_data(self):
         """Insert sample data for learning"""
-        # Students
-        students_data = [
-            (1, 'Alice Johnson', 'alice@email.com', 20, 'USA'),
-            (2, 'Bob Smith', 'bob@email.com', 22, 'Canada'),
-            (3, 'Carlos García', 'carlos@email.com', 21, 'Spain'),
-            (4, 'Diana Lee', 'diana@email.com', 19, 'South Korea'),
-            (5, 'Elena Rodríguez', 'elena@email.com', 23, 'Mexico'),
-            (6, 'Frank Miller', 'frank@email.com', 20, 'UK'),
-            (7, 'Gabriela Silva', 'gabi@email.com', 22, 'Brazil'),
-            (8, 'Hassan Ahmed', 'hassan@email.com', 21, 'Egypt')
-        ]
-
-        # Courses
-        courses_data = [
-            (1, 'Introduction to Programming', 'Dr. Smith', 3),
-            (2, 'Database Systems', 'Prof. Johnson', 4),
-            (3, 'Web Development', 'Dr. García', 3),
-            (4, 'Data Structures', 'Prof. Lee', 4),
-            (5, 'Machine Learning', 'Dr. Chen', 3),
-            (6, 'Computer Networks', 'Prof. Williams', 3)
-        ]
-
-        # Enrollments
-        enrollments_data = [
-            (1, 1, 1, '2024-01-15', 3.8),
-            (2, 1, 2, '2024-01-15', 3.5),
-            (3, 2, 1, '2024-01-16', 3.2),
-            (4, 2, 3, '2024-01-16', 3.9),
-            (5, 3, 2, '2024-01-17', 4.0),
-            (6, 3, 4, '2024-01-17', 3.7),
-            (7, 4, 1, '2024-01-18', 3.6),
-            (8, 4, 5, '2024-01-18', 3.8),
-            (9, 5, 3, '2024-01-19', 3.4),
-            (10, 5, 4, '2024-01-19', 3.9),
-            (11, 6, 2, '2024-01-20', 3.3),
-            (12, 6, 6, '2024-01-20', 3.7),
-            (13, 7, 1, '2024-01-21', 3.5),
-            (14, 8, 5, '2024-01-22', 3.6)
-        ]
-
-        self.cursor.executemany(
-            "INSERT OR IGNORE INTO students VALUES (?, ?, ?, ?, ?)", students_data
-        )
-        self.cursor.executemany(
-            "INSERT OR IGNORE INTO courses VALUES (?, ?, ?, ?)", courses_data
-        )
-        self.cursor.executemany(
-            "INSERT OR IGNORE INTO enrollments VALUES (?, ?, ?, ?, ?)", enrollments_data
-        )
-
-        self.conn.commit()
-
-    def execute_query(self, query):
-        """Execute SQL query and return results"""
+        for statement in _SEED_STATEMENTS:
+            self.cursor.execute(statement)
+
+    def execute_query(self, query, is_cancelled=None):
+        """Execute SQL query on the calling thread's own connection and return results
+
+        is_cancelled, if given, is polled while the statement runs; once it
+        returns True the statement is interrupted and reported as cancelled.
+        The caller clears the schema caches after DDL (see clear_schema_caches).
+        """
+        if self.conn is None:
+            return {'success': False, 'error': _CLOSED_ERROR}
+        conn = self._query_connection()
+        cursor = conn.cursor()
+        if is_cancelled is not None:
+            # SQLite calls this every CANCEL_CHECK_INSTRUCTIONS VM steps
+            conn.set_progress_handler(is_cancelled, self.CANCEL_CHECK_INSTRUCTIONS)
         try:
-            self.cursor.execute(query)
-
-            # Check if SELECT and fetch results BEFORE committing
-            if query.strip().upper().startswith('SELECT') and self.cursor.description:
-                columns = [description[0] for description in self.cursor.description]
-                rows = self.cursor.fetchall()
-                self._save_query_history(query, success=True)
-                return {'success': True, 'columns': columns, 'rows': rows}
+            cursor.execute(query)
+
+            # Check if SELECT (or a WITH ... SELECT) and fetch results BEFORE committing
+            if _is_select(query) and cursor.description:
+                rows = cursor.fetchall()
+                columns = self._result_columns(cursor, rows)
+                history_row = self._save_query_history(query, success=True)
+                return {'success': True, 'columns': columns, 'rows': rows, 'history_row': history_row}
             else:
-                # Only commit for non-SELECT queries (INSERT, UPDATE, DELETE, etc.)
-                self.conn.commit()
-                self._save_query_history(query, success=True)
-                return {'success': True, 'message': f'Query executed successfully. Rows affected: {self.cursor.rowcount}'}
+                # Only commit for non-SELECT queries; this also closes a
+                # transaction the user opened with their own BEGIN
+                conn.commit()
+                history_row = self._save_query_history(query, success=True)
+                return {
+                    'success': True,
+                    'message': f'Query executed successfully. Rows affected: {cursor.rowcount}',
+                    'history_row': history_row
+                }
 
         except sqlite3.Error as e:
-            self._save_query_history(query, success=False, error=str(e))
-            return {'success': False, 'error': str(e)}
+            if is_cancelled is not None and is_cancelled():
+                history_row = self._save_query_history(query, success=False, error='cancelled')
+                return {'success': False, 'error': 'cancelled', 'cancelled': True, 'history_row': history_row}
+            history_row = self._save_query_history(query, success=False, error=str(e))
+            return {'success': False, 'error': str(e), 'history_row': history_row}
+        finally:
+            if is_cancelled is not None:
+                conn.set_progress_handler(None, 0)
+
+    def _result_columns(self, cursor, rows):
+        """Column names of the cursor's last result, read from the shared sqlite3.Row keys"""
+        if rows:
+            return tuple(rows[0].keys())
+        return tuple(description[0] for description in cursor.description)
 
     def _save_query_history(self, query, success, error=None):
-        """Save query to history table"""
-        timestamp = datetime.now().isoformat()
-        self.cursor.execute(
-            "INSERT INTO query_history (query_text, executed_at, success, error_message) VALUES (?, ?, ?, ?)",
-            (query, timestamp, 1 if success else 0, error)
-        )
-        self.conn.commit()
+        """Buffer a query history row, flushing to disk in batches; returns the row"""
+        # success is a bool, which sqlite3 binds as INTEGER 1/0 directly
+        row = (query, time.time_ns(), success, error)
+        with self._history_lock:
+            self._history_buffer.append(row)
+            self.history_version += 1
+            full = len(self._history_buffer) > self.HISTORY_FLUSH_THRESHOLD
+        if full:
+            self.flush_query_history()
+        return row
+
+    def flush_query_history(self):
+        """Hand all buffered history rows to the writer thread as one batch"""
+        with self._history_lock:
+            if not self._history_buffer:
+                return
+            batch = list(self._history_buffer)
+            self._history_buffer.clear()
+            self._history_in_flight.append(batch)
+        self._writer_pool.start(_HistoryWriter(self, batch))
 
+    @_synchronized
     def get_query_history(self, limit=50):
-        """Retrieve recent query history"""
-        self.cursor.execute(
-            "SELECT query_text, executed_at, success, error_message FROM query_history ORDER BY id DESC LIMIT ?",
-            (limit,)
-        )
-        return self.cursor.fetchall()
+        """Retrieve recent query history, including rows not yet written"""
+        with self._history_lock:
+            pending = list(reversed(self._history_buffer))
+            for batch in reversed(self._history_in_flight):
+                pending.extend(reversed(batch))
+        if len(pending) >= limit:
+            return pending[:limit]
+        # A batch can commit before the writer drops it from the in-flight
+        # list, so skip stored rows already listed as pending
+        pending_times = {row[1] for row in pending}
+        self.cursor.execute(_SELECT_HISTORY_SQL, (limit,))
+        stored = [row for row in self.cursor.fetchall() if row[1] not in pending_times]
+        return pending + stored[:limit - len(pending)]
+
+    def close(self):
+        """Flush pending history, wait for the writer and close the connection"""
+        with self._lock:
+            if self.conn is None:
+                return
+            self.flush_query_history()
+            self._writer_pool.waitForDone()
+            self.conn.close()
+            self.conn = None
+            self.cursor = None
 
+    @_synchronized
     def get_table_data(self, table_name):
         """Get all data from a specific table"""
         try:
-            self.cursor.execute(f"SELECT * FROM {table_name}")
-            columns = [description[0] for description in self.cursor.description]
+            self.cursor.execute(f"SELECT * FROM {_quote_identifier(table_name)}")
             rows = self.cursor.fetchall()
+            columns = self._result_columns(self.cursor, rows)
             return {'success': True, 'columns': columns, 'rows': rows}
         except sqlite3.Error as e:
             return {'success': False, 'error': str(e)}
 
+    @_synchronized
+    def get_table_page(self, table_name, offset, limit):
+        """Get one page of rows from a specific table"""
+        try:
+            sql = self._select_page_sql.get(table_name)
+            if sql is None:
+                sql = f"SELECT * FROM {_quote_identifier(table_name)} LIMIT ? OFFSET ?"
+                self._select_page_sql[table_name] = sql
+            self.cursor.execute(sql, (limit, offset))
+            rows = self.cursor.fetchall()
+            columns = self._result_columns(self.cursor, rows)
+            return {'success': True, 'columns': columns, 'rows': rows}
+        except sqlite3.Error as e:
+            return {'success': False, 'error': str(e)}
+
+    @_synchronized
+    def get_row_count(self, table_name):
+        """Get the number of rows in a specific table"""
+        try:
+            self.cursor.execute(f"SELECT COUNT(*) FROM {_quote_identifier(table_name)}")
+            return {'success': True, 'count': self.cursor.fetchone()[0]}
+        except sqlite3.Error as e:
+            return {'success': False, 'error': str(e)}
+
+    @_synchronized
     def get_table_names(self):
         """Get list of user tables (excluding system tables)"""
         self.cursor.execute(
@@ -206,31 +512,49 @@ class DatabaseManager:
         )
         return [row[0] for row in self.cursor.fetchall()]
 
+    @_synchronized
     def mark_lesson_complete(self, lesson_id):
         """Mark a lesson as completed"""
-        timestamp = datetime.now().isoformat()
-        self.cursor.execute(
-            "INSERT OR REPLACE INTO lesson_progress (lesson_id, completed, completed_at) VALUES (?, 1, ?)",
-            (lesson_id, timestamp)
-        )
-        self.conn.commit()
+        timestamp = time.time_ns()
+        self.cursor.execute(_MARK_LESSON_SQL, (lesson_id, timestamp))
 
+    @_synchronized
     def is_lesson_complete(self, lesson_id):
         """Check if lesson is completed"""
-        self.cursor.execute(
-            "SELECT completed FROM lesson_progress WHERE lesson_id = ?",
-            (lesson_id,)
-        )
+        self.cursor.execute(_LESSON_COMPLETE_SQL, (lesson_id,))
         result = self.cursor.fetchone()
         return result[0] == 1 if result else False
 
+    @_synchronized
+    def get_completed_lesson_ids(self):
+        """Get the ids of all completed lessons in one query"""
+        self.cursor.execute(_COMPLETED_LESSONS_SQL)
+        return {row[0] for row in self.cursor.fetchall()}
+
+    @_synchronized
     def reset_lesson_progress(self):
         """Reset all lesson progress without affecting database content"""
         self.cursor.execute("DELETE FROM lesson_progress")
-        self.conn.commit()
 
-    def reset_database(self):
-        """Drop all tables and reinitialize with fresh data"""
+    @_synchronized
+    def reset_database(self, hard=False):
+        """Restore the learning tables to their sample data"""
+        self.clear_schema_caches()
+        if not hard:
+            # Clear and re-seed in one transaction so schema, indexes and cached
+            # statements survive. Tables a lesson dropped are recreated first;
+            # if a table no longer matches the schema, fall back to dropping.
+            try:
+                self.cursor.executescript("BEGIN IMMEDIATE;" + _SCHEMA_SQL + """
+                    DELETE FROM enrollments;
+                    DELETE FROM courses;
+                    DELETE FROM students;
+                    DELETE FROM lesson_progress;
+                """ + ';'.join(_SEED_STATEMENTS) + ";COMMIT;")
+                return
+            except sqlite3.Error:
+                self.conn.rollback()
+
         self.cursor.executescript("""
             DROP TABLE IF EXISTS students;
             DROP TABLE IF EXISTS courses;
@@ -238,13 +562,26 @@ class DatabaseManager:
             DROP TABLE IF EXISTS lesson_progress;
         """)
         # Keep query history
-        self.conn.commit()
         self.initialize_database()
 
+    @_synchronized
     def get_table_schema(self, table_name):
-        """Get column information for a table using PRAGMA table_info"""
+        """Get column information for a table using PRAGMA table_info (cached)
+
+        'schema' lists the columns in table order and 'by_name' maps each column
+        name to the same dict.
+        """
+        cached = self._schema_cache.get(table_name)
+        if cached is not None:
+            return {'success': True, 'schema': cached[0], 'by_name': cached[1]}
+
         try:
-            self.cursor.execute(f"PRAGMA table_info({table_name})")
+            # Table-valued form takes the name as a parameter, so one cached
+            # statement serves every table
+            self.cursor.execute(
+                'SELECT cid, name, type, "notnull", dflt_value, pk FROM pragma_table_info(?)',
+                (table_name,)
+            )
             columns_info = self.cursor.fetchall()
             # Returns list of tuples: (cid, name, type, notnull, dflt_value, pk)
             schema = []
@@ -253,21 +590,70 @@ class DatabaseManager:
                     'cid': col[0],
                     'name': col[1],
                     'type': col[2],
+                    'type_upper': col[2].upper(),
                     'notnull': col[3],
                     'default': col[4],
                     'pk': col[5]
                 })
-            return {'success': True, 'schema': schema}
+            by_name = {col['name']: col for col in schema}
+            # An empty result means the table does not exist (yet); don't cache it
+            if schema:
+                self._schema_cache[table_name] = (schema, by_name)
+            return {'success': True, 'schema': schema, 'by_name': by_name}
         except sqlite3.Error as e:
             return {'success': False, 'error': str(e)}
 
-    def get_primary_key(self, table_name):
-        """Get primary key column name(s) for a table"""
+    def clear_schema_caches(self):
+        """Forget cached schema and primary key information for all tables"""
+        self._schema_cache.clear()
+        self._pk_cache.clear()
+        self._default_row_cache.clear()
+
+    @_synchronized
+    def get_default_row(self, table_name):
+        """Get the values a newly added row starts with, one per column (cached)"""
+        default_row = self._default_row_cache.get(table_name)
+        if default_row is not None:
+            return {'success': True, 'default_row': default_row}
+
         schema_result = self.get_table_schema(table_name)
         if not schema_result['success']:
             return schema_result
 
-        pk_columns = [col['name'] for col in schema_result['schema'] if col['pk'] > 0]
+        default_values = []
+        for col in schema_result['schema']:
+            type_upper = col['type_upper']
+            # Auto-increment primary keys get NULL
+            if col['pk'] == 1 and type_upper == 'INTEGER':
+                default_values.append(None)
+            elif col['default'] is not None:
+                default_values.append(col['default'])
+            elif not col['notnull']:
+                default_values.append(None)
+            elif 'INT' in type_upper:
+                default_values.append(0)
+            elif 'REAL' in type_upper or 'FLOAT' in type_upper:
+                default_values.append(0.0)
+            else:
+                default_values.append('')
+
+        default_row = tuple(default_values)
+        if schema_result['schema']:
+            self._default_row_cache[table_name] = default_row
+        return {'success': True, 'default_row': default_row}
+
+    @_synchronized
+    def get_primary_key(self, table_name):
+        """Get primary key column name(s) for a table"""
+        pk_columns = self._pk_cache.get(table_name)
+        if pk_columns is None:
+            schema_result = self.get_table_schema(table_name)
+            if not schema_result['success']:
+                return schema_result
+
+            pk_columns = [col['name'] for col in schema_result['schema'] if col['pk'] > 0]
+            if schema_result['schema']:
+                self._pk_cache[table_name] = pk_columns
 
         if not pk_columns:
             return {'success': False, 'error': 'No primary key found'}
@@ -275,15 +661,27 @@ class DatabaseManager:
         # Return first PK column (most tables have single column PKs)
         return {'success': True, 'pk_column': pk_columns[0], 'pk_columns': pk_columns}
 
+    def _update_cell_sql(self, table_name, column_name, pk_column):
+        """Return the parameterised UPDATE for one column, formatting it only once"""
+        key = (table_name, column_name, pk_column)
+        sql = self._update_sql.get(key)
+        if sql is None:
+            sql = (
+                f"UPDATE {_quote_identifier(table_name)} SET {_quote_identifier(column_name)} = ? "
+                f"WHERE {_quote_identifier(pk_column)} = ?"
+            )
+            self._update_sql[key] = sql
+        return sql
+
+    @_synchronized
     def update_cell(self, table_name, pk_column, pk_value, column_name, new_value):
         """Update a single cell value and return the generated SQL"""
         try:
             # Generate UPDATE SQL
-            sql = f"UPDATE {table_name} SET {column_name} = ? WHERE {pk_column} = ?"
+            sql = self._update_cell_sql(table_name, column_name, pk_column)
 
             # Execute the update
             self.cursor.execute(sql, (new_value, pk_value))
-            self.conn.commit()
 
             # Save to query history with actual values for learning
             display_sql = f"UPDATE {table_name} SET {column_name} = '{new_value}' WHERE {pk_column} = {pk_value}"
@@ -299,8 +697,37 @@ class DatabaseManager:
             self._save_query_history(error_sql, success=False, error=str(e))
             return {'success': False, 'error': str(e), 'sql': error_sql}
 
+    @_synchronized
+    def update_cells(self, table_name, pk_column, updates):
+        """Apply (column_name, pk_value, new_value) updates in one transaction"""
+        display_sqls = [
+            f"UPDATE {table_name} SET {column_name} = '{new_value}' WHERE {pk_column} = {pk_value}"
+            for column_name, pk_value, new_value in updates
+        ]
+        try:
+            self.cursor.execute("BEGIN")
+            # Consecutive edits to the same column share one prepared statement
+            for column_name, group in groupby(updates, key=lambda update: update[0]):
+                sql = self._update_cell_sql(table_name, column_name, pk_column)
+                self.cursor.executemany(sql, [(new_value, pk_value) for _, pk_value, new_value in group])
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            for display_sql in display_sqls:
+                self._save_query_history(display_sql, success=False, error=str(e))
+            return {'success': False, 'error': str(e), 'sql': '\n'.join(display_sqls)}
+
+        for display_sql in display_sqls:
+            self._save_query_history(display_sql, success=True)
+        return {
+            'success': True,
+            'sql': '\n'.join(display_sqls),
+            'message': f'{len(updates)} cell(s) updated successfully'
+        }
+
+    @_synchronized
     def insert_row(self, table_name, column_values):
-        """Insert a new row and return the generated SQL"""
+        """Insert a new row and return the generated SQL along with the stored row"""
         try:
             # Get schema to identify columns (excluding auto-increment PKs)
             schema_result = self.get_table_schema(table_name)
@@ -312,11 +739,20 @@ class DatabaseManager:
             columns_str = ', '.join(columns)
 
             # Generate INSERT SQL
-            sql = f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})"
-
-            # Execute the insert
-            self.cursor.execute(sql, column_values)
-            self.conn.commit()
+            quoted_columns = ', '.join(_quote_identifier(col) for col in columns)
+            sql = f"INSERT INTO {_quote_identifier(table_name)} ({quoted_columns}) VALUES ({placeholders})"
+
+            # Execute the insert and read back the row as stored (defaults, rowid PK)
+            if _HAS_RETURNING:
+                self.cursor.execute(sql + " RETURNING *", column_values)
+                # Drain the statement so the autocommit write completes
+                row = self.cursor.fetchall()[0]
+            else:
+                self.cursor.execute(sql, column_values)
+                self.cursor.execute(
+                    f"SELECT * FROM {_quote_identifier(table_name)} WHERE rowid = ?", (self.cursor.lastrowid,)
+                )
+                row = self.cursor.fetchone()
 
             # Save to query history
             values_str = ', '.join([f"'{v}'" if v is not None else 'NULL' for v in column_values])
@@ -327,20 +763,21 @@ class DatabaseManager:
                 'success': True,
                 'sql': display_sql,
                 'message': f'Row inserted successfully',
-                'rowid': self.cursor.lastrowid
+                'rowid': self.cursor.lastrowid,
+                'row': row
             }
         except sqlite3.Error as e:
             return {'success': False, 'error': str(e)}
 
+    @_synchronized
     def delete_row(self, table_name, pk_column, pk_value):
         """Delete a row and return the generated SQL"""
         try:
             # Generate DELETE SQL
-            sql = f"DELETE FROM {table_name} WHERE {pk_column} = ?"
+            sql = f"DELETE FROM {_quote_identifier(table_name)} WHERE {_quote_identifier(pk_column)} = ?"
 
             # Execute the delete
             self.cursor.execute(sql, (pk_value,))
-            self.conn.commit()
 
             # Save to query history
             display_sql = f"DELETE FROM {table_name} WHERE {pk_column} = {pk_value}"
@@ -349,7 +786,8 @@ class DatabaseManager:
             return {
                 'success': True,
                 'sql': display_sql,
-                'message': f'Row deleted successfully'
+                'message': f'Row deleted successfully',
+                'rowcount': self.cursor.rowcount
             }
         except sqlite3.Error as e:
             display_sql = f"DELETE FROM {table_name} WHERE {pk_column} = {pk_value}"
@@ -361,513 +799,374 @@ class DatabaseManager:
 # Language Manager
 # ===========================
 
+class _Translations(dict):
+    """Translation table that falls back to the key itself for missing entries"""
+
+    def __missing__(self, key):
+        return key
+
+
+# Built once at import and shared by every LanguageManager instance
+_TRANSLATIONS = {
+    'en': _Translations({
+        # Menu and general
+        'app_title': 'easySql - Interactive SQL Learning',
+        'language': 'Language',
+        'database': 'Database',
+        'reset_db': 'Reset Database',
+        'reset_confirm': 'Are you sure you want to reset the database? All changes will be lost.',
+        'reset_success': 'Database has been reset successfully!',
+        'reset_progress': 'Reset Lesson Progress',
+        'reset_progress_confirm': 'Are you sure you want to reset all lesson progress? This will clear your completion history but keep the database intact.',
+        'reset_progress_success': 'Lesson progress has been reset successfully!',
+
+        # Tabs
+        'tab_beginner': 'Beginner Lessons',
+        'tab_advanced': 'Advanced/Dangerous',
+        'tab_viewer': 'Table Viewer',
+        'tab_console': 'SQL Console',
+
+        # Beginner lessons tab
+        'select_lesson': 'Select a lesson:',
+        'run_example': 'Run Example',
+        'mark_complete': 'Mark as Complete',
+        'completed': '✓ Completed',
+
+        # Advanced tab
+        'danger_warning': '⚠️ Warning: Dangerous Commands',
+        'danger_desc': 'These commands can delete or destroy data. Use with caution!',
+        'confirm_danger': 'Are you sure you want to execute this dangerous command?',
+
+        # Table viewer
+        'select_table': 'Select table:',
+        'refresh': 'Refresh',
+        'no_data': 'No data available',
+
+        # SQL Console
+        'console_title': 'SQL Console - Write and execute your own queries',
+        'query_placeholder': 'Enter your SQL query here...',
+        'execute_query': 'Execute Query',
+        'clear_console': 'Clear',
+        'cancel_query': 'Cancel',
+        'query_cancelled': 'Query cancelled',
+        'query_history': 'Query History',
+        'success': 'Success',
+        'error': 'Error',
+
+        # Messages
+        'query_executed': 'Query executed successfully!',
+        'rows_affected': 'Rows affected:',
+    }),
+    'es': _Translations({
+        # Menú y general
+        'app_title': 'easySql - Aprendizaje Interactivo de SQL',
+        'language': 'Idioma',
+        'database': 'Base de Datos',
+        'reset_db': 'Reiniciar Base de Datos',
+        'reset_confirm': '¿Está seguro de que desea reiniciar la base de datos? Todos los cambios se perderán.',
+        'reset_success': '¡La base de datos se ha reiniciado exitosamente!',
+        'reset_progress': 'Reiniciar Progreso de Lecciones',
+        'reset_progress_confirm': '¿Está seguro de que desea reiniciar todo el progreso de las lecciones? Esto borrará su historial de completado pero mantendrá la base de datos intacta.',
+        'reset_progress_success': '¡El progreso de las lecciones se ha reiniciado exitosamente!',
+
+        # Pestañas
+        'tab_beginner': 'Lecciones Básicas',
+        'tab_advanced': 'Avanzado/Peligroso',
+        'tab_viewer': 'Visor de Tablas',
+        'tab_console': 'Consola SQL',
+
+        # Pestaña de lecciones básicas
+        'select_lesson': 'Seleccione una lección:',
+        'run_example': 'Ejecutar Ejemplo',
+        'mark_complete': 'Marcar como Completada',
+        'completed': '✓ Completada',
+
+        # Pestaña avanzada
+        'danger_warning': '⚠️ Advertencia: Comandos Peligrosos',
+        'danger_desc': '¡Estos comandos pueden eliminar o destruir datos. Use con precaución!',
+        'confirm_danger': '¿Está seguro de que desea ejecutar este comando peligroso?',
+
+        # Visor de tablas
+        'select_table': 'Seleccionar tabla:',
+        'refresh': 'Actualizar',
+        'no_data': 'No hay datos disponibles',
+
+        # Consola SQL
+        'console_title': 'Consola SQL - Escriba y ejecute sus propias consultas',
+        'query_placeholder': 'Ingrese su consulta SQL aquí...',
+        'execute_query': 'Ejecutar Consulta',
+        'clear_console': 'Limpiar',
+        'cancel_query': 'Cancelar',
+        'query_cancelled': 'Consulta cancelada',
+        'query_history': 'Historial de Consultas',
+        'success': 'Éxito',
+        'error': 'Error',
+
+        # Mensajes
+        'query_executed': '¡Consulta ejecutada exitosamente!',
+        'rows_affected': 'Filas afectadas:',
+    })
+}
+
+
 class LanguageManager:
     """Manages multilingual translations (English and Spanish)"""
 
     def __init__(self):
         self.current_language = 'en'
-        self.translations = {
-            'en': {
-                # Menu and general
-                'app_title': 'easySql - Interactive SQL Learning',
-                'language': 'Language',
-                'database': 'Database',
-                'reset_db': 'Reset Database',
-                'reset_confirm': 'Are you sure you want to reset the database? All changes will be lost.',
-                'reset_success': 'Database has been reset successfully!',
-                'reset_progress': 'Reset Lesson Progress',
-                'reset_progress_confirm': 'Are you sure you want to reset all lesson progress? This will clear your completion history but keep the database intact.',
-                'reset_progress_success': 'Lesson progress has been reset successfully!',
-
-                # Tabs
-                'tab_beginner': 'Beginner Lessons',
-                'tab_advanced': 'Advanced/Dangerous',
-                'tab_viewer': 'Table Viewer',
-                'tab_console': 'SQL Console',
-
-                # Beginner lessons tab
-                'select_lesson': 'Select a lesson:',
-                'run_example': 'Run Example',
-                'mark_complete': 'Mark as Complete',
-                'completed': '✓ Completed',
-
-                # Advanced tab
-                'danger_warning': '⚠️ Warning: Dangerous Commands',
-                'danger_desc': 'These commands can delete or destroy data. Use with caution!',
-                'confirm_danger': 'Are you sure you want to execute this dangerous command?',
-
-                # Table viewer
-                'select_table': 'Select table:',
-                'refresh': 'Refresh',
-                'no_data': 'No data available',
-
-                # SQL Console
-                'console_title': 'SQL Console - Write and execute your own queries',
-                'query_placeholder': 'Enter your SQL query here...',
-                'execute_query': 'Execute Query',
-                'clear_console': 'Clear',
-                'query_history': 'Query History',
-                'success': 'Success',
-                'error': 'Error',
-
-                # Messages
-                'query_executed': 'Query executed successfully!',
-                'rows_affected': 'Rows affected:',
-            },
-            'es': {
-                # Menú y general
-                'app_title': 'easySql - Aprendizaje Interactivo de SQL',
-                'language': 'Idioma',
-                'database': 'Base de Datos',
-                'reset_db': 'Reiniciar Base de Datos',
-                'reset_confirm': '¿Está seguro de que desea reiniciar la base de datos? Todos los cambios se perderán.',
-                'reset_success': '¡La base de datos se ha reiniciado exitosamente!',
-                'reset_progress': 'Reiniciar Progreso de Lecciones',
-                'reset_progress_confirm': '¿Está seguro de que desea reiniciar todo el progreso de las lecciones? Esto borrará su historial de completado pero mantendrá la base de datos intacta.',
-                'reset_progress_success': '¡El progreso de las lecciones se ha reiniciado exitosamente!',
-
-                # Pestañas
-                'tab_beginner': 'Lecciones Básicas',
-                'tab_advanced': 'Avanzado/Peligroso',
-                'tab_viewer': 'Visor de Tablas',
-                'tab_console': 'Consola SQL',
-
-                # Pestaña de lecciones básicas
-                'select_lesson': 'Seleccione una lección:',
-                'run_example': 'Ejecutar Ejemplo',
-                'mark_complete': 'Marcar como Completada',
-                'completed': '✓ Completada',
-
-                # Pestaña avanzada
-                'danger_warning': '⚠️ Advertencia: Comandos Peligrosos',
-                'danger_desc': '¡Estos comandos pueden eliminar o destruir datos. Use con precaución!',
-                'confirm_danger': '¿Está seguro de que desea ejecutar este comando peligroso?',
-
-                # Visor de tablas
-                'select_table': 'Seleccionar tabla:',
-                'refresh': 'Actualizar',
-                'no_data': 'No hay datos disponibles',
-
-                # Consola SQL
-                'console_title': 'Consola SQL - Escriba y ejecute sus propias consultas',
-                'query_placeholder': 'Ingrese su consulta SQL aquí...',
-                'execute_query': 'Ejecutar Consulta',
-                'clear_console': 'Limpiar',
-                'query_history': 'Historial de Consultas',
-                'success': 'Éxito',
-                'error': 'Error',
-
-                # Mensajes
-                'query_executed': '¡Consulta ejecutada exitosamente!',
-                'rows_affected': 'Filas afectadas:',
-            }
-        }
+        self._active = _TRANSLATIONS['en']
+        # get(key) -> translation for key; rebound to the active table's
+        # __getitem__ so a lookup is a single dict access
+        self.get = self._active.__getitem__
 
     def set_language(self, lang_code):
         """Set current language"""
-        if lang_code in self.translations:
+        if lang_code in _TRANSLATIONS:
             self.current_language = lang_code
-
-    def get(self, key):
-        """Get translation for key"""
-        return self.translations[self.current_language].get(key, key)
+            self._active = _TRANSLATIONS[lang_code]
+            self.get = self._active.__getitem__
 
 
 # ===========================
 # Lesson Manager
 # ===========================
 
+# One record per lesson; a tuple with named fields is far smaller than a dict
+Lesson = namedtuple(
+    'Lesson',
+    'id title_en title_es description_en description_es sql dangerous',
+    defaults=(False,)
+)
+
+# Index entry for a lesson: just enough to list it, details load on demand
+LessonTitle = namedtuple('LessonTitle', 'id title_en title_es dangerous', defaults=(False,))
+
+
+# Shared prefixes of the dangerous-lesson descriptions
+_DANGER_EN = sys.intern('⚠️ DANGER: ')
+_DANGER_ES = sys.intern('⚠️ PELIGRO: ')
+
+# lessons.json holds the lesson index; lessons/<ID>.json holds each lesson's text and SQL
+_LESSON_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _intern_fields(record):
+    """Intern every string field so repeated values are stored only once"""
+    return {
+        field: sys.intern(value) if isinstance(value, str) else value
+        for field, value in record.items()
+    }
+
+
+def _build_lessons(lessons):
+    """Convert lesson index records into a read-only id -> LessonTitle mapping"""
+    # The id is only stored as the key in lessons.json; fill it in here
+    return MappingProxyType({
+        lesson_id: LessonTitle(id=sys.intern(lesson_id), **_intern_fields(lesson))
+        for lesson_id, lesson in lessons.items()
+    })
+
+
+def _load_lessons():
+    """Load the lesson index from lessons.json next to this script"""
+    with open(os.path.join(_LESSON_DIR, 'lessons.json'), encoding='utf-8') as f:
+        lessons = json.load(f)
+    return _build_lessons(lessons['beginner']), _build_lessons(lessons['advanced'])
+
+
+# Beginner-friendly and advanced/dangerous SQL lessons, parsed once at import
+_BEGINNER_LESSONS, _ADVANCED_LESSONS = _load_lessons()
+
+# Flat id -> LessonTitle lookup across both categories
+_LESSONS_BY_ID = MappingProxyType({**_BEGINNER_LESSONS, **_ADVANCED_LESSONS})
+
+# (category, language) -> ((lesson id, title), ...) ready to fill a combo box
+_LESSON_TITLES = MappingProxyType({
+    (category, language): tuple(
+        (lesson_id, lesson.title_es if language == 'es' else lesson.title_en)
+        for lesson_id, lesson in lessons.items()
+    )
+    for category, lessons in (('beginner', _BEGINNER_LESSONS), ('advanced', _ADVANCED_LESSONS))
+    for language in ('en', 'es')
+})
+
+
+@lru_cache(maxsize=64)
+def _load_lesson(lesson_id):
+    """Read one lesson's descriptions and SQL from lessons/<ID>.json"""
+    title = _LESSONS_BY_ID[lesson_id]
+    with open(os.path.join(_LESSON_DIR, 'lessons', f'{lesson_id}.json'), encoding='utf-8') as f:
+        details = json.load(f)
+    if title.dangerous:
+        details['description_en'] = _DANGER_EN + details['description_en']
+        details['description_es'] = _DANGER_ES + details['description_es']
+    return Lesson(**title._asdict(), **_intern_fields(details))
+
+
 class LessonManager:
     """Stores and manages SQL lessons"""
 
+    __slots__ = ('beginner_lessons', 'advanced_lessons', 'by_id')
+
     def __init__(self):
-        self.beginner_lessons = self._create_beginner_lessons()
-        self.advanced_lessons = self._create_advanced_lessons()
+        # Lesson indexes are built once at import and shared read-only
+        self.beginner_lessons = _BEGINNER_LESSONS
+        self.advanced_lessons = _ADVANCED_LESSONS
+        self.by_id = _LESSONS_BY_ID
 
-    def _create_beginner_lessons(self):
-        """Define beginner-friendly SQL lessons"""
-        return {
-            'SELECT_1': {
-                'id': 'SELECT_1',
-                'title_en': '1. SELECT - Basic Query',
-                'title_es': '1. SELECT - Consulta Básica',
-                'description_en': 'The SELECT statement retrieves data from a database table. Use * to select all columns, or specify column names.',
-                'description_es': 'La sentencia SELECT recupera datos de una tabla de base de datos. Use * para seleccionar todas las columnas, o especifique nombres de columnas.',
-                'sql': 'SELECT * FROM students;'
-            },
-            'SELECT_2': {
-                'id': 'SELECT_2',
-                'title_en': '2. SELECT - Specific Columns',
-                'title_es': '2. SELECT - Columnas Específicas',
-                'description_en': 'You can select specific columns instead of all columns. This is more efficient for large tables.',
-                'description_es': 'Puede seleccionar columnas específicas en lugar de todas las columnas. Esto es más eficiente para tablas grandes.',
-                'sql': 'SELECT name, email, country FROM students;'
-            },
-            'WHERE_1': {
-                'id': 'WHERE_1',
-                'title_en': '3. WHERE - Filter Results',
-                'title_es': '3. WHERE - Filtrar Resultados',
-                'description_en': 'The WHERE clause filters records based on conditions. Only rows that match the condition are returned.',
-                'description_es': 'La cláusula WHERE filtra registros basados en condiciones. Solo se devuelven las filas que coinciden con la condición.',
-                'sql': "SELECT name, age, country FROM students WHERE age >= 21;"
-            },
-            'WHERE_2': {
-                'id': 'WHERE_2',
-                'title_en': '4. WHERE - Multiple Conditions',
-                'title_es': '4. WHERE - Múltiples Condiciones',
-                'description_en': 'Use AND, OR operators to combine multiple conditions in WHERE clause.',
-                'description_es': 'Use los operadores AND, OR para combinar múltiples condiciones en la cláusula WHERE.',
-                'sql': "SELECT name, country FROM students WHERE age > 20 AND country = 'USA';"
-            },
-            'ORDER_1': {
-                'id': 'ORDER_1',
-                'title_en': '5. ORDER BY - Sort Results',
-                'title_es': '5. ORDER BY - Ordenar Resultados',
-                'description_en': 'ORDER BY sorts query results. Use ASC (ascending, default) or DESC (descending).',
-                'description_es': 'ORDER BY ordena los resultados de la consulta. Use ASC (ascendente, predeterminado) o DESC (descendente).',
-                'sql': 'SELECT name, age FROM students ORDER BY age DESC;'
-            },
-            'JOIN_1': {
-                'id': 'JOIN_1',
-                'title_en': '6. INNER JOIN - Combine Tables',
-                'title_es': '6. INNER JOIN - Combinar Tablas',
-                'description_en': 'INNER JOIN combines rows from two or more tables based on a related column. It returns only matching rows from both tables.',
-                'description_es': 'INNER JOIN combina filas de dos o más tablas basándose en una columna relacionada. Devuelve solo las filas coincidentes de ambas tablas.',
-                'sql': '''SELECT students.name, courses.course_name, enrollments.grade
-FROM enrollments
-INNER JOIN students ON enrollments.student_id = students.student_id
-INNER JOIN courses ON enrollments.course_id = courses.course_id;'''
-            },
-            'JOIN_2': {
-                'id': 'JOIN_2',
-                'title_en': '6a. INNER JOIN - Simple Two Tables',
-                'title_es': '6a. INNER JOIN - Dos Tablas Simples',
-                'description_en': 'INNER JOIN with just two tables. This shows students and their enrollment dates, excluding students without enrollments.',
-                'description_es': 'INNER JOIN con solo dos tablas. Esto muestra estudiantes y sus fechas de inscripción, excluyendo estudiantes sin inscripciones.',
-                'sql': '''SELECT students.name, students.country, enrollments.enrollment_date
-FROM students
-INNER JOIN enrollments ON students.student_id = enrollments.student_id
-ORDER BY enrollments.enrollment_date;'''
-            },
-            'JOIN_3': {
-                'id': 'JOIN_3',
-                'title_en': '6b. INNER JOIN - With WHERE Filter',
-                'title_es': '6b. INNER JOIN - Con Filtro WHERE',
-                'description_en': 'INNER JOIN combined with WHERE clause to filter results. This shows only students with grades above 3.5.',
-                'description_es': 'INNER JOIN combinado con cláusula WHERE para filtrar resultados. Esto muestra solo estudiantes con calificaciones superiores a 3.5.',
-                'sql': '''SELECT students.name, courses.course_name, enrollments.grade
-FROM enrollments
-INNER JOIN students ON enrollments.student_id = students.student_id
-INNER JOIN courses ON enrollments.course_id = courses.course_id
-WHERE enrollments.grade > 3.5
-ORDER BY enrollments.grade DESC;'''
-            },
-            'JOIN_4': {
-                'id': 'JOIN_4',
-                'title_en': '6c. LEFT JOIN - All Students',
-                'title_es': '6c. LEFT JOIN - Todos los Estudiantes',
-                'description_en': 'LEFT JOIN returns ALL rows from the left table (students), even if there are no matches in the right table (enrollments). Unmatched rows show NULL.',
-                'description_es': 'LEFT JOIN devuelve TODAS las filas de la tabla izquierda (estudiantes), incluso si no hay coincidencias en la tabla derecha (inscripciones). Las filas sin coincidencia muestran NULL.',
-                'sql': '''SELECT students.name, students.country, courses.course_name, enrollments.grade
-FROM students
-LEFT JOIN enrollments ON students.student_id = enrollments.student_id
-LEFT JOIN courses ON enrollments.course_id = courses.course_id
-ORDER BY students.name;'''
-            },
-            'JOIN_5': {
-                'id': 'JOIN_5',
-                'title_en': '6d. LEFT JOIN - All Courses',
-                'title_es': '6d. LEFT JOIN - Todos los Cursos',
-                'description_en': 'LEFT JOIN showing all courses and their enrollments. Courses with no students enrolled will show NULL in student columns.',
-                'description_es': 'LEFT JOIN mostrando todos los cursos y sus inscripciones. Los cursos sin estudiantes inscritos mostrarán NULL en las columnas de estudiantes.',
-                'sql': '''SELECT courses.course_name, courses.instructor, students.name, enrollments.grade
-FROM courses
-LEFT JOIN enrollments ON courses.course_id = enrollments.course_id
-LEFT JOIN students ON enrollments.student_id = students.student_id
-ORDER BY courses.course_name;'''
-            },
-            'JOIN_6': {
-                'id': 'JOIN_6',
-                'title_en': '6e. LEFT ANTI JOIN - Find Unmatched Rows',
-                'title_es': '6e. LEFT ANTI JOIN - Encontrar Filas Sin Coincidencia',
-                'description_en': 'ANTI JOIN finds rows in one table with NO match in another table. Using LEFT JOIN with IS NULL achieves this anti-join pattern. This finds students not enrolled in any course.',
-                'description_es': 'ANTI JOIN encuentra filas en una tabla SIN coincidencia en otra tabla. Usar LEFT JOIN con IS NULL logra este patrón anti-join. Esto encuentra estudiantes no inscritos en ningún curso.',
-                'sql': '''SELECT students.name, students.email, students.country
-FROM students
-LEFT JOIN enrollments ON students.student_id = enrollments.student_id
-WHERE enrollments.enrollment_id IS NULL;'''
-            },
-            'JOIN_7': {
-                'id': 'JOIN_7',
-                'title_en': '6f. RIGHT JOIN - All Courses',
-                'title_es': '6f. RIGHT JOIN - Todos los Cursos',
-                'description_en': 'RIGHT JOIN returns ALL rows from the right table (courses), even if there are no matches in the left table. Note: SQLite does not support RIGHT JOIN, so this uses LEFT JOIN with reversed table order.',
-                'description_es': 'RIGHT JOIN devuelve TODAS las filas de la tabla derecha (cursos), incluso si no hay coincidencias en la tabla izquierda. Nota: SQLite no soporta RIGHT JOIN, así que esto usa LEFT JOIN con orden de tablas invertido.',
-                'sql': '''SELECT courses.course_name, courses.credits, students.name
-FROM courses
-LEFT JOIN enrollments ON courses.course_id = enrollments.course_id
-LEFT JOIN students ON enrollments.student_id = students.student_id
-ORDER BY courses.course_name;'''
-            },
-            'JOIN_8': {
-                'id': 'JOIN_8',
-                'title_en': '6g. Understanding JOIN Types',
-                'title_es': '6g. Entendiendo Tipos de JOIN',
-                'description_en': 'This query demonstrates the difference between INNER JOIN and LEFT JOIN. INNER JOIN shows only enrolled students, LEFT JOIN shows all students.',
-                'description_es': 'Esta consulta demuestra la diferencia entre INNER JOIN y LEFT JOIN. INNER JOIN muestra solo estudiantes inscritos, LEFT JOIN muestra todos los estudiantes.',
-                'sql': '''SELECT
-    COUNT(DISTINCT students.student_id) as total_students,
-    COUNT(DISTINCT enrollments.enrollment_id) as total_enrollments
-FROM students
-LEFT JOIN enrollments ON students.student_id = enrollments.student_id;'''
-            },
-            'JOIN_9': {
-                'id': 'JOIN_9',
-                'title_en': '6h. FULL OUTER JOIN - All Records from Both Tables',
-                'title_es': '6h. FULL OUTER JOIN - Todos los Registros de Ambas Tablas',
-                'description_en': 'FULL OUTER JOIN returns ALL rows from both tables, showing NULL where there are no matches. SQLite does not support FULL OUTER JOIN directly, so this simulates it using UNION of LEFT JOIN patterns. This shows all students AND all courses, including unmatched records from both sides.',
-                'description_es': 'FULL OUTER JOIN devuelve TODAS las filas de ambas tablas, mostrando NULL donde no hay coincidencias. SQLite no soporta FULL OUTER JOIN directamente, así que esto lo simula usando UNION de patrones LEFT JOIN. Esto muestra todos los estudiantes Y todos los cursos, incluyendo registros sin coincidencia de ambos lados.',
-                'sql': '''SELECT students.name, courses.course_name, enrollments.grade
-FROM students
-LEFT JOIN enrollments ON students.student_id = enrollments.student_id
-LEFT JOIN courses ON enrollments.course_id = courses.course_id
-
-UNION
-
-SELECT students.name, courses.course_name, enrollments.grade
-FROM courses
-LEFT JOIN enrollments ON courses.course_id = enrollments.course_id
-LEFT JOIN students ON enrollments.student_id = students.student_id
-WHERE students.student_id IS NULL
-ORDER BY name, course_name;'''
-            },
-            'CASE_1': {
-                'id': 'CASE_1',
-                'title_en': '6i. CASE - Grade Categories',
-                'title_es': '6i. CASE - Categorías de Calificaciones',
-                'description_en': 'CASE creates conditional logic in SQL. This categorizes grades as Excellent (>3.5), Good (3.0-3.5), Pass (2.0-3.0), or Fail (<2.0).',
-                'description_es': 'CASE crea lógica condicional en SQL. Esto categoriza calificaciones como Excelente (>3.5), Bueno (3.0-3.5), Aprobado (2.0-3.0), o Reprobado (<2.0).',
-                'sql': '''SELECT
-    students.name,
-    courses.course_name,
-    enrollments.grade,
-    CASE
-        WHEN enrollments.grade >= 3.5 THEN 'Excellent'
-        WHEN enrollments.grade >= 3.0 THEN 'Good'
-        WHEN enrollments.grade >= 2.0 THEN 'Pass'
-        ELSE 'Fail'
-    END as grade_category
-FROM enrollments
-INNER JOIN students ON enrollments.student_id = students.student_id
-INNER JOIN courses ON enrollments.course_id = courses.course_id
-ORDER BY enrollments.grade DESC;'''
-            },
-            'CASE_2': {
-                'id': 'CASE_2',
-                'title_en': '6j. CASE - Multiple Conditions',
-                'title_es': '6j. CASE - Múltiples Condiciones',
-                'description_en': 'CASE with multiple conditions. This categorizes students by age groups: Youth (<21), Young Adult (21-25), Adult (>25).',
-                'description_es': 'CASE con múltiples condiciones. Esto categoriza estudiantes por grupos de edad: Joven (<21), Adulto Joven (21-25), Adulto (>25).',
-                'sql': '''SELECT
-    name,
-    age,
-    country,
-    CASE
-        WHEN age < 21 THEN 'Youth'
-        WHEN age BETWEEN 21 AND 25 THEN 'Young Adult'
-        ELSE 'Adult'
-    END as age_group,
-    CASE
-        WHEN country IN ('USA', 'Canada', 'Mexico') THEN 'North America'
-        WHEN country IN ('Spain', 'France', 'Germany') THEN 'Europe'
-        WHEN country IN ('China', 'Japan', 'Korea') THEN 'Asia'
-        ELSE 'Other'
-    END as region
-FROM students
-ORDER BY age;'''
-            },
-            'CASE_3': {
-                'id': 'CASE_3',
-                'title_en': '6k. CASE with JOIN - Complex Logic',
-                'title_es': '6k. CASE con JOIN - Lógica Compleja',
-                'description_en': 'CASE combined with JOIN for complex logic. This shows student performance and credit earned based on grade.',
-                'description_es': 'CASE combinado con JOIN para lógica compleja. Esto muestra rendimiento estudiantil y créditos obtenidos basados en calificación.',
-                'sql': '''SELECT
-    students.name,
-    courses.course_name,
-    courses.credits,
-    enrollments.grade,
-    CASE
-        WHEN enrollments.grade >= 2.0 THEN courses.credits
-        ELSE 0
-    END as credits_earned,
-    CASE
-        WHEN enrollments.grade >= 3.5 THEN 'Honor Roll'
-        WHEN enrollments.grade >= 2.0 THEN 'Passed'
-        ELSE 'Failed'
-    END as status
-FROM enrollments
-INNER JOIN students ON enrollments.student_id = students.student_id
-INNER JOIN courses ON enrollments.course_id = courses.course_id
-ORDER BY students.name, enrollments.grade DESC;'''
-            },
-            'CASE_4': {
-                'id': 'CASE_4',
-                'title_en': '6l. CASE with GROUP BY - Aggregation',
-                'title_es': '6l. CASE con GROUP BY - Agregación',
-                'description_en': 'CASE with GROUP BY and aggregation functions. This counts how many students achieved each grade level per course.',
-                'description_es': 'CASE con GROUP BY y funciones de agregación. Esto cuenta cuántos estudiantes alcanzaron cada nivel de calificación por curso.',
-                'sql': '''SELECT
-    courses.course_name,
-    COUNT(*) as total_students,
-    SUM(CASE WHEN enrollments.grade >= 3.5 THEN 1 ELSE 0 END) as excellent_count,
-    SUM(CASE WHEN enrollments.grade >= 3.0 AND enrollments.grade < 3.5 THEN 1 ELSE 0 END) as good_count,
-    SUM(CASE WHEN enrollments.grade >= 2.0 AND enrollments.grade < 3.0 THEN 1 ELSE 0 END) as pass_count,
-    SUM(CASE WHEN enrollments.grade < 2.0 THEN 1 ELSE 0 END) as fail_count,
-    ROUND(AVG(enrollments.grade), 2) as avg_grade
-FROM enrollments
-INNER JOIN courses ON enrollments.course_id = courses.course_id
-GROUP BY courses.course_name
-ORDER BY avg_grade DESC;'''
-            },
-            'INSERT_1': {
-                'id': 'INSERT_1',
-                'title_en': '7. INSERT - Add New Data',
-                'title_es': '7. INSERT - Agregar Nuevos Datos',
-                'description_en': 'INSERT adds new rows to a table. Specify column names and values.',
-                'description_es': 'INSERT agrega nuevas filas a una tabla. Especifique nombres de columnas y valores.',
-                'sql': "INSERT OR REPLACE INTO students (student_id, name, email, age, country) VALUES (9, 'New Student', 'new@email.com', 20, 'USA');"
-            },
-            'UPDATE_1': {
-                'id': 'UPDATE_1',
-                'title_en': '8. UPDATE - Modify Data',
-                'title_es': '8. UPDATE - Modificar Datos',
-                'description_en': 'UPDATE modifies existing data. Always use WHERE to specify which rows to update!',
-                'description_es': 'UPDATE modifica datos existentes. ¡Siempre use WHERE para especificar qué filas actualizar!',
-                'sql': "UPDATE students SET age = 21 WHERE name = 'New Student';"
-            },
-            'DELETE_1': {
-                'id': 'DELETE_1',
-                'title_en': '9. DELETE - Remove Data',
-                'title_es': '9. DELETE - Eliminar Datos',
-                'description_en': 'DELETE removes rows from a table. Always use WHERE to specify which rows to delete!',
-                'description_es': 'DELETE elimina filas de una tabla. ¡Siempre use WHERE para especificar qué filas eliminar!',
-                'sql': "DELETE FROM students WHERE name = 'New Student';"
-            },
-            'CREATE_1': {
-                'id': 'CREATE_1',
-                'title_en': '10. CREATE TABLE - Make New Table',
-                'title_es': '10. CREATE TABLE - Crear Nueva Tabla',
-                'description_en': 'CREATE TABLE creates a new table with specified columns and data types.',
-                'description_es': 'CREATE TABLE crea una nueva tabla con columnas y tipos de datos especificados.',
-                'sql': '''CREATE TABLE IF NOT EXISTS test_table (
-    id INTEGER PRIMARY KEY,
-    name TEXT NOT NULL,
-    created_at TEXT
-);'''
-            }
-        }
+    def get(self, lesson_id):
+        """Get a full lesson by id, regardless of its category"""
+        return _load_lesson(lesson_id)
 
-    def _create_advanced_lessons(self):
-        """Define advanced/dangerous SQL lessons"""
-        return {
-            'DROP_1': {
-                'id': 'DROP_1',
-                'title_en': 'DROP TABLE - Delete Entire Table',
-                'title_es': 'DROP TABLE - Eliminar Tabla Completa',
-                'description_en': '⚠️ DANGER: DROP TABLE permanently deletes an entire table and all its data. This cannot be undone! Use only when you are absolutely sure.',
-                'description_es': '⚠️ PELIGRO: DROP TABLE elimina permanentemente una tabla completa y todos sus datos. ¡Esto no se puede deshacer! Use solo cuando esté absolutamente seguro.',
-                'sql': 'DROP TABLE IF EXISTS test_table;',
-                'dangerous': True
-            },
-            'DELETE_ALL': {
-                'id': 'DELETE_ALL',
-                'title_en': 'DELETE - Remove All Rows',
-                'title_es': 'DELETE - Eliminar Todas las Filas',
-                'description_en': '⚠️ DANGER: DELETE without WHERE removes ALL rows from a table. The table structure remains but all data is gone.',
-                'description_es': '⚠️ PELIGRO: DELETE sin WHERE elimina TODAS las filas de una tabla. La estructura de la tabla permanece pero todos los datos desaparecen.',
-                'sql': 'DELETE FROM enrollments;',
-                'dangerous': True
-            },
-            'DROP_STUDENTS': {
-                'id': 'DROP_STUDENTS',
-                'title_en': 'DROP TABLE students',
-                'title_es': 'DROP TABLE students',
-                'description_en': '⚠️ DANGER: This will completely remove the students table. All student data will be permanently lost!',
-                'description_es': '⚠️ PELIGRO: Esto eliminará completamente la tabla students. ¡Todos los datos de estudiantes se perderán permanentemente!',
-                'sql': 'DROP TABLE IF EXISTS students;',
-                'dangerous': True
-            },
-            'DROP_COURSES': {
-                'id': 'DROP_COURSES',
-                'title_en': 'DROP TABLE courses',
-                'title_es': 'DROP TABLE courses',
-                'description_en': '⚠️ DANGER: This will completely remove the courses table and all course information.',
-                'description_es': '⚠️ PELIGRO: Esto eliminará completamente la tabla courses y toda la información de cursos.',
-                'sql': 'DROP TABLE IF EXISTS courses;',
-                'dangerous': True
-            }
-        }
+    def titles(self, category, language):
+        """(lesson id, title) pairs of a category ('beginner' or 'advanced') in a language"""
+        return _LESSON_TITLES[category, 'es' if language == 'es' else 'en']
 
 
 # ===========================
 # Table Model for QTableView
 # ===========================
 
+# Looked up on every data()/headerData() call; resolve the enums once
+_DISPLAY = int(Qt.ItemDataRole.DisplayRole)
+_EDIT = int(Qt.ItemDataRole.EditRole)
+_H = Qt.Orientation.Horizontal
+
+# Item flags for read-only and editable cells
+_FLAGS_RO = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+_FLAGS_RW = _FLAGS_RO | Qt.ItemFlag.ItemIsEditable
+
+
+def _make_validator(column_schema):
+    """Build a validator specialised for one column's type and NOT NULL constraint"""
+    notnull = bool(column_schema.get('notnull'))
+    column_type = column_schema.get('type_upper', 'TEXT')
+
+    if 'INT' in column_type:
+        convert, type_label = int, 'INTEGER'
+    elif 'REAL' in column_type or 'FLOAT' in column_type or 'DOUBLE' in column_type:
+        convert, type_label = float, 'REAL/FLOAT'
+    else:
+        # TEXT - accept anything
+        convert, type_label = str, 'TEXT'
+
+    def validate(value):
+        # Handle empty string
+        if value == '' or value is None:
+            if notnull:
+                return None, "Column cannot be NULL"
+            return None, None
+        try:
+            return convert(value), None
+        except ValueError:
+            return None, f"Invalid {type_label} value: '{value}'"
+
+    return validate
+
+
+# Used for columns without schema information
+_DEFAULT_VALIDATOR = _make_validator({})
+
+
 class TableModel(QAbstractTableModel):
     """Custom table model for displaying SQL query results with editing support"""
 
+    __slots__ = (
+        '_columns', '_col_index', '_cols', '_db', '_table_name', '_pk_column', '_pk_index',
+        '_schema', '_validators', '_flags_by_col', '_display_cache', '_row_labels',
+        '_pending', '_flush_timer', '_stream', '_stream_timer',
+    )
+
     # Signal emitted when SQL is generated (for display purposes)
     sql_generated = pyqtSignal(str)
 
+    # Idle time before queued cell edits are written to the database
+    FLUSH_DELAY_MS = 50
+
+    # Rows added per event-loop pass when a large result is loaded
+    STREAM_CHUNK = 1000
+
     def __init__(self, data=None, columns=None, db=None, table_name=None):
         super().__init__()
-        # Convert tuples to lists for mutability
-        self._data = [list(row) for row in (data or [])]
         self._columns = columns or []
+        self._col_index = {name: i for i, name in enumerate(self._columns)}
+        # Values are stored column-major: self._cols[col][row]
+        self._cols = self._to_columns(data or [], len(self._columns))
         self._db = db  # Database manager reference
         self._table_name = table_name  # Current table name
         self._pk_column = None  # Primary key column name
         self._pk_index = None  # Primary key column index
         self._schema = {}  # Column schema information
+        self._validators = {}  # Column name -> validator built from the schema
+        self._flags_by_col = []  # Item flags per column, see _build_flags
+        self._display_cache = {}  # (row, col) -> display string
+        self._row_labels = [str(i + 1) for i in range(self.rowCount())]
+        # Cell edits waiting to be written: (row, col, old_value, column_name, pk_value, new_value)
+        self._pending = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush_pending)
+        # Remaining chunks of a large result, appended from the event loop
+        self._stream = None
+        self._stream_timer = QTimer(self)
+        self._stream_timer.setInterval(0)
+        self._stream_timer.timeout.connect(self._stream_next)
+        self._build_flags()
+
+    @staticmethod
+    def _to_columns(rows, column_count):
+        """Transpose fetched rows into one list per column"""
+        if not rows:
+            return [[] for _ in range(column_count)]
+        return list(map(list, zip(*rows)))
 
     def rowCount(self, parent=None):
-        return len(self._data)
+        return len(self._cols[0]) if self._cols else 0
 
     def columnCount(self, parent=None):
         return len(self._columns)
 
-    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
-        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
-            value = self._data[index.row()][index.column()]
-            return str(value) if value is not None else ''
-        return None
-
-    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
-        if role == Qt.ItemDataRole.DisplayRole:
-            if orientation == Qt.Orientation.Horizontal:
-                return self._columns[section]
-            else:
-                return str(section + 1)
-        return None
+    def data(self, index, role=_DISPLAY):
+        if role != _DISPLAY and role != _EDIT:
+            return None
+        key = (index.row(), index.column())
+        text = self._display_cache.get(key)
+        if text is None:
+            value = self._cols[key[1]][key[0]]
+            text = str(value) if value is not None else ''
+            self._display_cache[key] = text
+        return text
+
+    def headerData(self, section, orientation, role=_DISPLAY):
+        if role != _DISPLAY:
+            return None
+        if orientation == _H:
+            return self._columns[section]
+        return self._row_labels[section]
 
     def flags(self, index):
         """Make cells editable if we have database connection and table info"""
-        if self._db and self._table_name and self._pk_column is not None:
-            # Don't allow editing the primary key column if it's auto-increment
-            if index.column() == self._pk_index:
-                pk_info = self._schema.get(self._pk_column, {})
-                if pk_info.get('type', '').upper() == 'INTEGER' and pk_info.get('pk') == 1:
-                    # Auto-increment INTEGER PRIMARY KEY - read only
-                    return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-
-            return Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-        else:
+        return self._flags_by_col[index.column()]
+
+    def _build_flags(self):
+        """Work out the item flags of each column once per result or table"""
+        if not (self._db and self._table_name and self._pk_column is not None):
             # Read-only mode (for SQL console results, lesson results, etc.)
-            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+            self._flags_by_col = [_FLAGS_RO] * len(self._columns)
+            return
+
+        self._flags_by_col = [_FLAGS_RW] * len(self._columns)
+
+        # Don't allow editing the primary key column if it's auto-increment
+        pk_info = self._schema.get(self._pk_column, {})
+        if (self._pk_index is not None and pk_info.get('type_upper') == 'INTEGER'
+                and pk_info.get('pk') == 1):
+            # Auto-increment INTEGER PRIMARY KEY - read only
+            self._flags_by_col[self._pk_index] = _FLAGS_RO
 
     def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
-        """Handle cell edits with immediate database update"""
+        """Handle cell edits, queueing the database update"""
         if role != Qt.ItemDataRole.EditRole:
             return False
 
@@ -876,87 +1175,112 @@ class TableModel(QAbstractTableModel):
 
         row = index.row()
         col = index.column()
-        old_value = self._data[row][col]
+        old_value = self._cols[col][row]
         column_name = self._columns[col]
 
-        # Don't update if value hasn't changed
-        if str(old_value) == str(value):
-            return False
-
-        # Get primary key value for WHERE clause
-        pk_value = self._data[row][self._pk_index]
-
         # Validate data type
-        column_schema = self._schema.get(column_name, {})
-        validated_value, error = self._validate_value(value, column_schema)
+        validated_value, error = self._validate_value(value, column_name)
 
         if error:
             # Emit signal with error for display
             self.sql_generated.emit(f"ERROR: {error}")
             return False
 
-        # Update database
-        result = self._db.update_cell(
+        # Don't update if value hasn't changed (compared as typed values)
+        if old_value == validated_value:
+            return False
+
+        # Get primary key value for WHERE clause
+        pk_value = self._cols[self._pk_index][row]
+
+        # Update local data now; the database write follows once edits go idle
+        self._set_cell(row, col, validated_value)
+        self._pending.append((row, col, old_value, column_name, pk_value, validated_value))
+        self._flush_timer.start()
+        return True
+
+    def _set_cell(self, row, col, value):
+        """Store a cell value and notify the view"""
+        self._cols[col][row] = value
+        self._display_cache.pop((row, col), None)
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+
+    def flush_pending(self):
+        """Write queued cell edits to the database in a single transaction"""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        result = self._db.update_cells(
             self._table_name,
             self._pk_column,
-            pk_value,
-            column_name,
-            validated_value
+            [(column_name, pk_value, new_value) for _, _, _, column_name, pk_value, new_value in pending]
         )
 
         if result['success']:
-            # Update local data
-            self._data[row][col] = validated_value
-            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
-
             # Emit SQL for display
             self.sql_generated.emit(result['sql'])
-            return True
         else:
-            # Emit error
+            # Nothing was written; put the old values back (newest edit first)
+            for row, col, old_value, _, _, _ in reversed(pending):
+                self._set_cell(row, col, old_value)
             self.sql_generated.emit(f"ERROR: {result.get('error', 'Unknown error')}")
-            return False
 
-    def _validate_value(self, value, column_schema):
+    def _validate_value(self, value, column_name):
         """Validate value based on column type"""
-        # Handle empty string
-        if value == '' or value is None:
-            if column_schema.get('notnull'):
-                return None, "Column cannot be NULL"
-            return None, None
-
-        column_type = column_schema.get('type', 'TEXT').upper()
-
-        # INTEGER validation
-        if 'INT' in column_type:
-            try:
-                return int(value), None
-            except ValueError:
-                return None, f"Invalid INTEGER value: '{value}'"
-
-        # REAL/FLOAT validation
-        elif 'REAL' in column_type or 'FLOAT' in column_type or 'DOUBLE' in column_type:
-            try:
-                return float(value), None
-            except ValueError:
-                return None, f"Invalid REAL/FLOAT value: '{value}'"
-
-        # TEXT - accept anything
-        else:
-            return str(value), None
+        return self._validators.get(column_name, _DEFAULT_VALIDATOR)(value)
 
     def update_data(self, data, columns):
-        """Update table data (read-only mode)"""
+        """Update table data (read-only mode)
+
+        data may be any iterable of rows; only the first STREAM_CHUNK rows are
+        loaded here and the rest are appended in chunks from the event loop.
+        """
+        # Queued edits refer to the current rows; write them before they go away
+        self.flush_pending()
+        self._stream_timer.stop()
+        rows = iter(data)
+        first_chunk = list(islice(rows, self.STREAM_CHUNK))
+        self._stream = iter(lambda: list(islice(rows, self.STREAM_CHUNK)), [])
+
         self.beginResetModel()
-        self._data = [list(row) for row in data]
         self._columns = columns
+        self._col_index = {name: i for i, name in enumerate(columns)}
+        self._cols = self._to_columns(first_chunk, len(columns))
+        self._display_cache.clear()
+        self._row_labels = [str(i + 1) for i in range(self.rowCount())]
         # Clear editing metadata
         self._table_name = None
         self._pk_column = None
         self._pk_index = None
         self._schema = {}
+        self._validators = {}
+        self._build_flags()
         self.endResetModel()
 
+        if len(first_chunk) == self.STREAM_CHUNK:
+            self._stream_timer.start()
+
+    def _stream_next(self):
+        """Append the next chunk of a large result"""
+        rows = next(self._stream, None)
+        if rows is None:
+            self._stream_timer.stop()
+            self._stream = None
+            return
+        self._append_rows(rows)
+
+    def _append_rows(self, rows):
+        """Append rows to the end of the model"""
+        start = self.rowCount()
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        for column, values in zip(self._cols, zip(*rows)):
+            column.extend(values)
+        self._row_labels.extend(str(i + 1) for i in range(start, start + len(rows)))
+        self.endInsertRows()
+
     def set_editable(self, db, table_name):
         """Enable editing mode for this table"""
         self._db = db
@@ -967,25 +1291,162 @@ class TableModel(QAbstractTableModel):
         if pk_result['success']:
             self._pk_column = pk_result['pk_column']
             # Find PK column index
-            try:
-                self._pk_index = self._columns.index(self._pk_column)
-            except ValueError:
-                self._pk_index = None
+            self._pk_index = self._col_index.get(self._pk_column)
 
         # Get schema for validation
         schema_result = db.get_table_schema(table_name)
         if schema_result['success']:
-            # Convert schema list to dict keyed by column name
-            self._schema = {col['name']: col for col in schema_result['schema']}
+            self._schema = schema_result['by_name']
+            self._validators = {name: _make_validator(col) for name, col in self._schema.items()}
+
+        self._build_flags()
+
+    def append_row(self, row):
+        """Add one row (in column order) to the end of the model"""
+        self._append_rows([row])
+
+    def remove_row(self, row):
+        """Remove one row from the model"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        for column in self._cols:
+            del column[row]
+        # Rows below moved up, so their cached strings and labels shift
+        self._display_cache.clear()
+        self._row_labels.pop()
+        self.endRemoveRows()
+
+    def col_index(self, name):
+        """Position of the named column (raises KeyError if there is no such column)"""
+        return self._col_index[name]
+
+    def cell_value(self, row, col):
+        """Stored (unformatted) value of a cell"""
+        return self._cols[col][row]
+
+    def is_loaded(self, table_name):
+        """Whether table_name is the table currently loaded for editing"""
+        return table_name == self._table_name and bool(self._schema)
+
+    def loaded_pk(self, table_name):
+        """Primary key column of table_name if it is loaded, else None"""
+        return self._pk_column if self.is_loaded(table_name) else None
+
+
+class LazyTableModel(TableModel):
+    """Editable table model that loads a database table one page at a time"""
+
+    __slots__ = ('_total_rows',)
+
+    PAGE_SIZE = 256
+
+    def __init__(self, db=None):
+        super().__init__(db=db)
+        self._total_rows = 0  # Row count of the loaded table
+
+    def load_table(self, db, table_name):
+        """Load the first page of a table and enable editing"""
+        self.flush_pending()
+        count_result = db.get_row_count(table_name)
+        if not count_result['success']:
+            return count_result
+
+        result = db.get_table_page(table_name, 0, self.PAGE_SIZE)
+        if not result['success']:
+            return result
+
+        self.update_data(result['rows'], result['columns'])
+        self._total_rows = count_result['count']
+        self.set_editable(db, table_name)
+        return result
+
+    def update_data(self, data, columns):
+        """Update table data (read-only mode, no further pages)"""
+        self._total_rows = 0
+        super().update_data(data, columns)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._db or not self._table_name:
+            return False
+        return self.rowCount() < self._total_rows
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Append the next page of rows as the view scrolls"""
+        if not self.canFetchMore(parent):
+            return
+
+        start = self.rowCount()
+        result = self._db.get_table_page(self._table_name, start, self.PAGE_SIZE)
+        if not result['success'] or not result['rows']:
+            # Table shrank since it was counted; stop paging
+            self._total_rows = start
+            return
+
+        self._append_rows(result['rows'])
+
+    def append_row(self, row):
+        """Add a row inserted at the end of the table"""
+        # While pages are still pending, the row arrives with the last page
+        fully_loaded = not self.canFetchMore()
+        self._total_rows += 1
+        if fully_loaded:
+            super().append_row(row)
+
+    def remove_row(self, row):
+        """Remove a row deleted from the table"""
+        self._total_rows -= 1
+        super().remove_row(row)
+
+
+# ===========================
+# Background Query Execution
+# ===========================
+
+class WorkerSignals(QObject):
+    """Signals emitted by a QueryWorker (QRunnable cannot emit signals itself)"""
+
+    finished = pyqtSignal(dict)
+
+
+class QueryWorker(QRunnable):
+    """Runs one SQL statement off the GUI thread and reports the result dict"""
+
+    def __init__(self, db, sql):
+        super().__init__()
+        self._db = db
+        self._sql = sql
+        self._cancelled = False
+        self.signals = WorkerSignals()
+
+    def cancel(self):
+        """Ask the running statement to stop at its next progress check"""
+        self._cancelled = True
+
+    def run(self):
+        # execute_query uses this thread's own connection, so the GUI thread
+        # keeps the shared connection while the statement runs
+        result = self._db.execute_query(self._sql, is_cancelled=lambda: self._cancelled)
+        self.signals.finished.emit(result)
 
 
 # ===========================
 # Main Window
 # ===========================
 
+_HISTORY_SEPARATOR = "-" * 50 + "\n"
+
+# Lesson combo item role holding whether the lesson is completed
+_COMPLETED_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
 class MainWindow(QMainWindow):
     """Main application window with tabbed interface"""
 
+    # Number of entries shown in the console's query history
+    HISTORY_ENTRIES = 20
+
+    # Longest time generated SQL waits before it is shown in the SQL panel
+    SQL_DISPLAY_DELAY_MS = 50
+
     def __init__(self):
         super().__init__()
 
@@ -994,12 +1455,44 @@ class MainWindow(QMainWindow):
         self.lang = LanguageManager()
         self.lessons = LessonManager()
 
-        # Ask for language on startup
-        self.select_language()
+        # User queries run here, one at a time, so the UI stays responsive
+        self.query_pool = QThreadPool(self)
+        self.query_pool.setMaxThreadCount(1)
+        # Keep the query thread (and its database connection) alive between queries
+        self.query_pool.setExpiryTimeout(-1)
+        self._console_worker = None
+
+        # Set when queries may have changed the table list (DDL) or the
+        # viewer's rows, so switching to the viewer only reloads what changed
+        self._schema_dirty = False
+        self._viewer_dirty = False
+
+        # Ask for language on first launch only; the choice is remembered
+        self.settings = QSettings('EasySql', 'EasySql')
+        saved_language = self.settings.value('language')
+        if saved_language:
+            self.lang.set_language(saved_language)
+        else:
+            self.select_language()
+            self.settings.setValue('language', self.lang.current_language)
 
         # Setup UI
         self.init_ui()
 
+    def closeEvent(self, event):
+        """Drain pending background work before the window closes"""
+        self.stop_queries()
+        if self._tab_built[2]:
+            self.viewer_model.flush_pending()
+        self.db.close()
+        super().closeEvent(event)
+
+    def stop_queries(self):
+        """Cancel the running console query and wait for the query pool to drain"""
+        if self._console_worker is not None:
+            self._console_worker.cancel()
+        self.query_pool.waitForDone()
+
     def select_language(self):
         """Show language selection dialog"""
         msg = QMessageBox()
@@ -1035,15 +1528,27 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         layout.addWidget(self.tabs)
 
-        # Add tabs
-        self.create_beginner_tab()
-        self.create_advanced_tab()
-        self.create_viewer_tab()
-        self.create_console_tab()
+        # Add placeholder tabs; each one is built the first time it is shown
+        self._tab_builders = (
+            self.create_beginner_tab,
+            self.create_advanced_tab,
+            self.create_viewer_tab,
+            self.create_console_tab,
+        )
+        self._tab_built = [False] * len(self._tab_builders)
+        for title_key in ('tab_beginner', 'tab_advanced', 'tab_viewer', 'tab_console'):
+            self.tabs.addTab(QWidget(), self.lang.get(title_key))
+        self.build_tab(0)
 
-        # Connect tab change signal to refresh viewer when switched to
+        # Connect tab change signal to build tabs and refresh viewer when switched to
         self.tabs.currentChanged.connect(self.on_tab_changed)
 
+    def build_tab(self, index):
+        """Build the contents of a tab if that has not happened yet"""
+        if not self._tab_built[index]:
+            self._tab_built[index] = True
+            self._tab_builders[index](self.tabs.widget(index))
+
     def create_menu_bar(self):
         """Create application menu bar"""
         menubar = self.menuBar()
@@ -1073,6 +1578,7 @@ class MainWindow(QMainWindow):
     def change_language(self, lang_code):
         """Change application language and refresh UI"""
         self.lang.set_language(lang_code)
+        self.settings.setValue('language', self.lang.current_language)
 
         # Show message and require restart for full effect
         msg = QMessageBox()
@@ -1093,14 +1599,16 @@ class MainWindow(QMainWindow):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
+            self.stop_queries()
             self.db.reset_database()
+            self._schema_dirty = True
             QMessageBox.information(
                 self,
                 self.lang.get('reset_db'),
                 self.lang.get('reset_success')
             )
-            # Refresh table viewer if visible
-            if hasattr(self, 'table_viewer'):
+            # Refresh table viewer if it has been built
+            if self._tab_built[2]:
                 self.refresh_table_viewer()
 
     def reset_lesson_progress(self):
@@ -1116,18 +1624,12 @@ class MainWindow(QMainWindow):
             self.db.reset_lesson_progress()
 
             # Refresh beginner lesson combo box to remove checkmarks
-            if hasattr(self, 'lesson_combo'):
-                current_lesson_id = self.lesson_combo.currentData()
-                self.lesson_combo.clear()
-
-                for lesson_id, lesson in self.lessons.beginner_lessons.items():
-                    title = lesson['title_es'] if self.lang.current_language == 'es' else lesson['title_en']
-                    self.lesson_combo.addItem(title, lesson_id)
-
-                # Restore selection
-                index = self.lesson_combo.findData(current_lesson_id)
-                if index >= 0:
-                    self.lesson_combo.setCurrentIndex(index)
+            if self._tab_built[0]:
+                # Clear the check marks in place; titles and selection are unchanged
+                self.lesson_combo.setUpdatesEnabled(False)
+                for index in range(self.lesson_combo.count()):
+                    self.set_lesson_completed(index, False)
+                self.lesson_combo.setUpdatesEnabled(True)
 
                 # Update the current lesson's complete button
                 self.display_lesson()
@@ -1138,9 +1640,8 @@ class MainWindow(QMainWindow):
                 self.lang.get('reset_progress_success')
             )
 
-    def create_beginner_tab(self):
-        """Create beginner lessons tab"""
-        tab = QWidget()
+    def create_beginner_tab(self, tab):
+        """Create beginner lessons tab inside its placeholder widget"""
         layout = QVBoxLayout()
         tab.setLayout(layout)
 
@@ -1149,10 +1650,11 @@ class MainWindow(QMainWindow):
         selector_layout.addWidget(QLabel(self.lang.get('select_lesson')))
 
         self.lesson_combo = QComboBox()
-        for lesson_id, lesson in self.lessons.beginner_lessons.items():
-            title = lesson['title_es'] if self.lang.current_language == 'es' else lesson['title_en']
-            completed = ' ' + self.lang.get('completed') if self.db.is_lesson_complete(lesson_id) else ''
-            self.lesson_combo.addItem(title + completed, lesson_id)
+        self._completed_icon = self.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton)
+        completed_ids = self.db.get_completed_lesson_ids()
+        for index, (lesson_id, title) in enumerate(self.lessons.titles('beginner', self.lang.current_language)):
+            self.lesson_combo.addItem(title, lesson_id)
+            self.set_lesson_completed(index, lesson_id in completed_ids)
 
         self.lesson_combo.currentIndexChanged.connect(self.display_lesson)
         selector_layout.addWidget(self.lesson_combo)
@@ -1192,8 +1694,6 @@ class MainWindow(QMainWindow):
         self.lesson_results.setMinimumHeight(200)
         layout.addWidget(self.lesson_results)
 
-        self.tabs.addTab(tab, self.lang.get('tab_beginner'))
-
         # Display first lesson
         self.display_lesson()
 
@@ -1203,20 +1703,20 @@ class MainWindow(QMainWindow):
         if not lesson_id:
             return
 
-        lesson = self.lessons.beginner_lessons[lesson_id]
+        lesson = self.lessons.get(lesson_id)
 
         # Display description
-        description = lesson['description_es'] if self.lang.current_language == 'es' else lesson['description_en']
+        description = lesson.description_es if self.lang.current_language == 'es' else lesson.description_en
         self.lesson_description.setPlainText(description)
 
         # Display SQL
-        self.lesson_sql.setPlainText(lesson['sql'])
+        self.lesson_sql.setPlainText(lesson.sql)
 
         # Clear results table when switching lessons
         self.lesson_model.update_data([], [])
 
         # Update complete button
-        if self.db.is_lesson_complete(lesson_id):
+        if self.lesson_combo.currentData(_COMPLETED_ROLE):
             self.mark_complete_btn.setText(self.lang.get('completed'))
             self.mark_complete_btn.setEnabled(False)
         else:
@@ -1229,8 +1729,31 @@ class MainWindow(QMainWindow):
         if not sql:
             return
 
-        result = self.db.execute_query(sql)
+        self.run_query_async(sql, self.run_example_btn, self.on_lesson_query_done)
+
+    def run_query_async(self, sql, button, on_done):
+        """Run SQL on the query pool, disabling button until on_done(result) has run"""
+        button.setEnabled(False)
 
+        def finished(result):
+            # The window closed while the query ran; there is nothing to update
+            if self.db.conn is None:
+                return
+            button.setEnabled(True)
+            if result['success'] and 'rows' not in result:
+                self._viewer_dirty = True
+                if _is_schema_change(sql):
+                    self.db.clear_schema_caches()
+                    self._schema_dirty = True
+            on_done(result)
+
+        worker = QueryWorker(self.db, sql)
+        worker.signals.finished.connect(finished)
+        self.query_pool.start(worker)
+        return worker
+
+    def on_lesson_query_done(self, result):
+        """Show the result of a lesson example"""
         if result['success']:
             if 'columns' in result and 'rows' in result:
                 self.lesson_model.update_data(result['rows'], result['columns'])
@@ -1247,15 +1770,16 @@ class MainWindow(QMainWindow):
             self.mark_complete_btn.setText(self.lang.get('completed'))
             self.mark_complete_btn.setEnabled(False)
 
-            # Update combo box text
-            current_index = self.lesson_combo.currentIndex()
-            current_text = self.lesson_combo.currentText()
-            if self.lang.get('completed') not in current_text:
-                self.lesson_combo.setItemText(current_index, current_text + ' ' + self.lang.get('completed'))
+            # Check the lesson off in the combo box
+            self.set_lesson_completed(self.lesson_combo.currentIndex(), True)
+
+    def set_lesson_completed(self, index, completed):
+        """Store a lesson's completion on its combo item and show it as a check icon"""
+        self.lesson_combo.setItemData(index, completed, _COMPLETED_ROLE)
+        self.lesson_combo.setItemIcon(index, self._completed_icon if completed else QIcon())
 
-    def create_advanced_tab(self):
-        """Create advanced/dangerous commands tab"""
-        tab = QWidget()
+    def create_advanced_tab(self, tab):
+        """Create advanced/dangerous commands tab inside its placeholder widget"""
         layout = QVBoxLayout()
         tab.setLayout(layout)
 
@@ -1272,8 +1796,7 @@ class MainWindow(QMainWindow):
         selector_layout.addWidget(QLabel(self.lang.get('select_lesson')))
 
         self.adv_lesson_combo = QComboBox()
-        for lesson_id, lesson in self.lessons.advanced_lessons.items():
-            title = lesson['title_es'] if self.lang.current_language == 'es' else lesson['title_en']
+        for lesson_id, title in self.lessons.titles('advanced', self.lang.current_language):
             self.adv_lesson_combo.addItem(title, lesson_id)
 
         self.adv_lesson_combo.currentIndexChanged.connect(self.display_advanced_lesson)
@@ -1304,8 +1827,6 @@ class MainWindow(QMainWindow):
         self.adv_results.setMinimumHeight(200)
         layout.addWidget(self.adv_results)
 
-        self.tabs.addTab(tab, self.lang.get('tab_advanced'))
-
         # Display first lesson
         self.display_advanced_lesson()
 
@@ -1315,11 +1836,11 @@ class MainWindow(QMainWindow):
         if not lesson_id:
             return
 
-        lesson = self.lessons.advanced_lessons[lesson_id]
+        lesson = self.lessons.get(lesson_id)
 
-        description = lesson['description_es'] if self.lang.current_language == 'es' else lesson['description_en']
+        description = lesson.description_es if self.lang.current_language == 'es' else lesson.description_en
         self.adv_description.setPlainText(description)
-        self.adv_sql.setPlainText(lesson['sql'])
+        self.adv_sql.setPlainText(lesson.sql)
 
         # Clear results when switching lessons
         self.adv_results.clear()
@@ -1339,17 +1860,18 @@ class MainWindow(QMainWindow):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            result = self.db.execute_query(sql)
+            self.run_query_async(sql, self.run_adv_btn, self.on_advanced_query_done)
 
-            if result['success']:
-                message = result.get('message', self.lang.get('query_executed'))
-                self.adv_results.setPlainText(f"{self.lang.get('success')}: {message}")
-            else:
-                self.adv_results.setPlainText(f"{self.lang.get('error')}: {result['error']}")
+    def on_advanced_query_done(self, result):
+        """Show the result of an advanced example"""
+        if result['success']:
+            message = result.get('message', self.lang.get('query_executed'))
+            self.adv_results.setPlainText(f"{self.lang.get('success')}: {message}")
+        else:
+            self.adv_results.setPlainText(f"{self.lang.get('error')}: {result['error']}")
 
-    def create_viewer_tab(self):
-        """Create table viewer tab with inline editing support"""
-        tab = QWidget()
+    def create_viewer_tab(self, tab):
+        """Create table viewer tab with inline editing support inside its placeholder widget"""
         layout = QVBoxLayout()
         tab.setLayout(layout)
 
@@ -1358,7 +1880,6 @@ class MainWindow(QMainWindow):
         selector_layout.addWidget(QLabel(self.lang.get('select_table')))
 
         self.table_combo = QComboBox()
-        self.update_table_list()
         self.table_combo.currentIndexChanged.connect(self.refresh_table_viewer)
         selector_layout.addWidget(self.table_combo)
 
@@ -1378,7 +1899,7 @@ class MainWindow(QMainWindow):
 
         # Table view
         self.table_viewer = QTableView()
-        self.viewer_model = TableModel()
+        self.viewer_model = LazyTableModel()
         self.table_viewer.setModel(self.viewer_model)
 
         # Connect SQL signal to display
@@ -1390,33 +1911,65 @@ class MainWindow(QMainWindow):
         sql_panel_label = QLabel("Generated SQL Commands:")
         layout.addWidget(sql_panel_label)
 
-        self.sql_display = QTextEdit()
+        # Plain text, so generated SQL containing markup is shown literally
+        self.sql_display = QPlainTextEdit()
         self.sql_display.setReadOnly(True)
+        # Keep only the most recent lines so long sessions don't grow unbounded
+        self.sql_display.setMaximumBlockCount(500)
+
+        # Generated SQL lines are buffered and written to the panel together
+        self._sql_buffer = []
+        self._sql_timer = QTimer(self)
+        self._sql_timer.setSingleShot(True)
+        self._sql_timer.setInterval(self.SQL_DISPLAY_DELAY_MS)
+        self._sql_timer.timeout.connect(self.flush_sql_display)
         self.sql_display.setMaximumHeight(100)
         self.sql_display.setPlaceholderText("SQL commands will appear here when you edit, add, or delete rows...")
         layout.addWidget(self.sql_display)
 
-        self.tabs.addTab(tab, self.lang.get('tab_viewer'))
-
-        # Load first table
-        if self.table_combo.count() > 0:
-            self.refresh_table_viewer()
+        # Fill the table list and load the first table
+        self.update_table_list()
 
     def update_table_list(self):
-        """Update table dropdown list"""
-        self.table_combo.clear()
+        """Update table dropdown list, keeping the selected table if it still exists"""
+        self._schema_dirty = False
+        current_table = self.table_combo.currentText()
         tables = self.db.get_table_names()
+
+        # Rebuild without firing refresh_table_viewer or relayouting per item
+        self.table_combo.blockSignals(True)
+        self.table_combo.setUpdatesEnabled(False)
+        self.table_combo.clear()
         self.table_combo.addItems(tables)
+        index = self.table_combo.findText(current_table)
+        if index >= 0:
+            self.table_combo.setCurrentIndex(index)
+        self.table_combo.setUpdatesEnabled(True)
+        self.table_combo.blockSignals(False)
+
+        # Load the newly selected table if the selection moved
+        if self.table_combo.currentText() != current_table:
+            self.refresh_table_viewer()
 
     def on_tab_changed(self, index):
         """Handle tab change events - refresh viewer when switched to"""
+        if not self._tab_built[index]:
+            # A freshly built tab already shows current data
+            self.build_tab(index)
+            return
+
         # Viewer tab is at index 2 (Beginner=0, Advanced=1, Viewer=2, Console=3)
-        if index == 2 and hasattr(self, 'table_combo'):
-            # Update table list in case new tables were created
-            self.update_table_list()
-            # Refresh the currently selected table
-            if self.table_combo.count() > 0:
+        if index == 2:
+            # Update table list only if tables were created or dropped
+            if self._schema_dirty:
+                self.update_table_list()
+            # Refresh the currently selected table if queries changed data
+            if self._viewer_dirty and self.table_combo.count() > 0:
                 self.refresh_table_viewer()
+        # Console tab: pick up queries run from the other tabs, if any
+        elif index == 3:
+            if self.db.history_version != self._history_version:
+                self.update_query_history()
 
     def refresh_table_viewer(self):
         """Refresh table viewer with selected table data and enable editing"""
@@ -1424,16 +1977,14 @@ class MainWindow(QMainWindow):
         if not table_name:
             return
 
-        result = self.db.get_table_data(table_name)
+        # Load the first page and enable editing; more rows load on scroll
+        result = self.viewer_model.load_table(self.db, table_name)
 
         if result['success']:
-            # Update data
-            self.viewer_model.update_data(result['rows'], result['columns'])
-
-            # Enable editing mode
-            self.viewer_model.set_editable(self.db, table_name)
-
-            # Clear SQL display
+            self._viewer_dirty = False
+            # Clear SQL display, including lines not shown yet
+            self._sql_timer.stop()
+            self._sql_buffer.clear()
             self.sql_display.clear()
         else:
             QMessageBox.critical(self, self.lang.get('error'), result['error'])
@@ -1441,14 +1992,16 @@ class MainWindow(QMainWindow):
     def display_sql_command(self, sql):
         """Display generated SQL command in the SQL panel"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        current_text = self.sql_display.toPlainText()
-
-        if current_text:
-            new_text = current_text + f"\n[{timestamp}] {sql}"
-        else:
-            new_text = f"[{timestamp}] {sql}"
+        self._sql_buffer.append(f"[{timestamp}] {sql}")
+        if not self._sql_timer.isActive():
+            self._sql_timer.start()
 
-        self.sql_display.setPlainText(new_text)
+    def flush_sql_display(self):
+        """Append all buffered SQL lines to the SQL panel at once"""
+        self._sql_timer.stop()
+        if self._sql_buffer:
+            self.sql_display.appendPlainText('\n'.join(self._sql_buffer))
+            self._sql_buffer.clear()
 
     def add_table_row(self):
         """Add a new row to the current table"""
@@ -1456,40 +2009,24 @@ class MainWindow(QMainWindow):
         if not table_name:
             return
 
-        # Get schema to build default row
-        schema_result = self.db.get_table_schema(table_name)
-        if not schema_result['success']:
-            QMessageBox.critical(self, "Error", schema_result['error'])
+        # Default values are worked out once per table schema
+        defaults_result = self.db.get_default_row(table_name)
+        if not defaults_result['success']:
+            QMessageBox.critical(self, "Error", defaults_result['error'])
             return
 
-        schema = schema_result['schema']
-
-        # Create default values for each column
-        default_values = []
-        for col in schema:
-            # Auto-increment primary keys get NULL
-            if col['pk'] == 1 and col['type'].upper() == 'INTEGER':
-                default_values.append(None)
-            elif col['default'] is not None:
-                default_values.append(col['default'])
-            elif not col['notnull']:
-                default_values.append(None)
-            elif 'INT' in col['type'].upper():
-                default_values.append(0)
-            elif 'REAL' in col['type'].upper() or 'FLOAT' in col['type'].upper():
-                default_values.append(0.0)
-            else:
-                default_values.append('')
-
         # Insert row
-        result = self.db.insert_row(table_name, default_values)
+        result = self.db.insert_row(table_name, list(defaults_result['default_row']))
 
         if result['success']:
             # Display SQL
             self.display_sql_command(result['sql'])
 
-            # Refresh table to show new row
-            self.refresh_table_viewer()
+            # Show the new row without reloading the table
+            if self.viewer_model.is_loaded(table_name) and result.get('row') is not None:
+                self.viewer_model.append_row(result['row'])
+            else:
+                self.refresh_table_viewer()
         else:
             self.display_sql_command(f"ERROR: {result.get('error', 'Unknown error')}")
             QMessageBox.critical(self, "Error", result.get('error', 'Unknown error'))
@@ -1518,19 +2055,20 @@ class MainWindow(QMainWindow):
         if not table_name:
             return
 
-        # Get primary key column and value
-        pk_result = self.db.get_primary_key(table_name)
-        if not pk_result['success']:
-            QMessageBox.critical(self, "Error", pk_result['error'])
-            return
-
-        pk_column = pk_result['pk_column']
+        # Get primary key column and value; the viewer already resolved it with the table
+        pk_column = self.viewer_model.loaded_pk(table_name)
+        if pk_column is None:
+            pk_result = self.db.get_primary_key(table_name)
+            if not pk_result['success']:
+                QMessageBox.critical(self, "Error", pk_result['error'])
+                return
+            pk_column = pk_result['pk_column']
 
         # Get PK value from the selected row
         try:
-            pk_index = self.viewer_model._columns.index(pk_column)
-            pk_value = self.viewer_model._data[row_index][pk_index]
-        except (ValueError, IndexError) as e:
+            pk_index = self.viewer_model.col_index(pk_column)
+            pk_value = self.viewer_model.cell_value(row_index, pk_index)
+        except (KeyError, IndexError) as e:
             QMessageBox.critical(self, "Error", f"Could not get primary key value: {e}")
             return
 
@@ -1545,6 +2083,9 @@ class MainWindow(QMainWindow):
         if reply != QMessageBox.StandardButton.Yes:
             return
 
+        # Write queued cell edits first so the primary key matches the database
+        self.viewer_model.flush_pending()
+
         # Delete row
         result = self.db.delete_row(table_name, pk_column, pk_value)
 
@@ -1552,15 +2093,18 @@ class MainWindow(QMainWindow):
             # Display SQL
             self.display_sql_command(result['sql'])
 
-            # Refresh table
-            self.refresh_table_viewer()
+            # Drop the row from the view without reloading the table, unless the
+            # key matched no row (NULL key) or several (composite key)
+            if result['rowcount'] == 1:
+                self.viewer_model.remove_row(row_index)
+            else:
+                self.refresh_table_viewer()
         else:
             self.display_sql_command(f"ERROR: {result.get('error', 'Unknown error')}")
             QMessageBox.critical(self, "Error", result.get('error', 'Unknown error'))
 
-    def create_console_tab(self):
-        """Create SQL console tab with query history"""
-        tab = QWidget()
+    def create_console_tab(self, tab):
+        """Create SQL console tab with query history inside its placeholder widget"""
         layout = QVBoxLayout()
         tab.setLayout(layout)
 
@@ -1576,9 +2120,14 @@ class MainWindow(QMainWindow):
         # Buttons
         btn_layout = QHBoxLayout()
 
-        execute_btn = QPushButton(self.lang.get('execute_query'))
-        execute_btn.clicked.connect(self.execute_console_query)
-        btn_layout.addWidget(execute_btn)
+        self.execute_btn = QPushButton(self.lang.get('execute_query'))
+        self.execute_btn.clicked.connect(self.execute_console_query)
+        btn_layout.addWidget(self.execute_btn)
+
+        self.cancel_query_btn = QPushButton(self.lang.get('cancel_query'))
+        self.cancel_query_btn.setEnabled(False)
+        self.cancel_query_btn.clicked.connect(self.cancel_console_query)
+        btn_layout.addWidget(self.cancel_query_btn)
 
         clear_btn = QPushButton(self.lang.get('clear_console'))
         clear_btn.clicked.connect(lambda: self.console_input.clear())
@@ -1617,8 +2166,6 @@ class MainWindow(QMainWindow):
 
         layout.addWidget(splitter)
 
-        self.tabs.addTab(tab, self.lang.get('tab_console'))
-
         # Load query history
         self.update_query_history()
 
@@ -1628,9 +2175,20 @@ class MainWindow(QMainWindow):
         if not query:
             return
 
-        result = self.db.execute_query(query)
+        self._console_worker = self.run_query_async(query, self.execute_btn, self.on_console_query_done)
+        self.cancel_query_btn.setEnabled(True)
 
-        if result['success']:
+    def cancel_console_query(self):
+        """Interrupt the running console query"""
+        self._console_worker.cancel()
+        self.cancel_query_btn.setEnabled(False)
+
+    def on_console_query_done(self, result):
+        """Show the result of a console query"""
+        self.cancel_query_btn.setEnabled(False)
+        if result.get('cancelled'):
+            QMessageBox.information(self, self.lang.get('cancel_query'), self.lang.get('query_cancelled'))
+        elif result['success']:
             if 'columns' in result and 'rows' in result:
                 self.console_model.update_data(result['rows'], result['columns'])
             else:
@@ -1639,25 +2197,51 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, self.lang.get('error'), result['error'])
 
         # Update history
-        self.update_query_history()
+        self.add_history_row(result.get('history_row'))
 
-        # Update table list in case new tables were created
-        self.update_table_list()
+        # Update table list in case tables were created or dropped
+        if self._schema_dirty and self._tab_built[2]:
+            self.update_table_list()
 
     def update_query_history(self):
         """Update query history display"""
-        history = self.db.get_query_history(20)
-
-        history_text = ""
-        for query, timestamp, success, error in history:
-            status = self.lang.get('success') if success else self.lang.get('error')
-            history_text += f"[{timestamp}] {status}\n"
-            history_text += f"{query}\n"
-            if error:
-                history_text += f"Error: {error}\n"
-            history_text += "-" * 50 + "\n"
-
-        self.history_view.setPlainText(history_text)
+        self._history_version = self.db.history_version
+        history = self.db.get_query_history(self.HISTORY_ENTRIES)
+        entries = [self._format_history_entry(*row) for row in history]
+        # Size of each shown entry in document positions (UTF-16 code units), newest first
+        self._history_sizes = deque(len(entry.encode('utf-16-le')) // 2 for entry in entries)
+        self.history_view.setPlainText(''.join(entries))
+
+    def add_history_row(self, row):
+        """Insert a query's history row at the top of the history display"""
+        # Rows saved by other tabs since the last refresh need a full reload
+        if row is None or self.db.history_version != self._history_version + 1:
+            self.update_query_history()
+            return
+        self._history_version += 1
+        entry = self._format_history_entry(*row)
+
+        # A fresh cursor starts at the top of the document
+        document = self.history_view.document()
+        cursor = QTextCursor(document)
+        cursor.insertText(entry)
+        self._history_sizes.appendleft(len(entry.encode('utf-16-le')) // 2)
+
+        # Drop the oldest entries from the bottom
+        while len(self._history_sizes) > self.HISTORY_ENTRIES:
+            end = document.characterCount() - 1
+            cursor.setPosition(end - self._history_sizes.pop())
+            cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+            cursor.removeSelectedText()
+
+    def _format_history_entry(self, query, timestamp, success, error):
+        """Format one query history row for the history display"""
+        status = self.lang.get('success') if success else self.lang.get('error')
+        parts = [f"[{_format_timestamp(timestamp)}] {status}\n", f"{query}\n"]
+        if error:
+            parts.append(f"Error: {error}\n")
+        parts.append(_HISTORY_SEPARATOR)
+        return ''.join(parts)
 
 
 # ===========================